@@ -0,0 +1,81 @@
+"""Indexing of NWS alerts for AREDN Mesh Weather."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+# Properties kept in the compact summary of an alert
+SUMMARY_KEYS = ("id", "event", "severity", "expires")
+# Long-form properties, available but not recorded
+DETAIL_KEYS = ("headline", "description", "instruction")
+
+_NEVER = datetime.max.replace(tzinfo=UTC)
+
+
+def _expiry(properties: Mapping[str, Any]) -> datetime:
+    """Return when an alert expires, or never if it does not say."""
+    try:
+        expires = datetime.fromisoformat(properties["expires"])
+    except (KeyError, TypeError, ValueError):
+        return _NEVER
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=UTC)
+    return expires
+
+
+class AlertIndex:
+    """NWS alerts deduplicated by id and ordered by expiry."""
+
+    __slots__ = ("_alerts", "_expiries")
+
+    def __init__(self, features: Iterable[Mapping[str, Any]]) -> None:
+        """Index the features of an NWS alert collection."""
+        by_id: dict[str, Mapping[str, Any]] = {}
+        for feature in features:
+            properties = feature.get("properties") or {}
+            alert_id = properties.get("id") or feature.get("id")
+            if alert_id is not None:
+                by_id[alert_id] = properties
+        ordered = sorted(
+            (_expiry(properties), alert_id) for alert_id, properties in by_id.items()
+        )
+        self._expiries = [expires for expires, _ in ordered]
+        self._alerts = [(alert_id, by_id[alert_id]) for _, alert_id in ordered]
+
+    def __len__(self) -> int:
+        """Return the number of alerts, including expired ones."""
+        return len(self._alerts)
+
+    def active(
+        self, now: datetime | None = None
+    ) -> list[tuple[str, Mapping[str, Any]]]:
+        """Return ``(id, properties)`` of alerts not expired at ``now``."""
+        now = now or datetime.now(UTC)
+        return self._alerts[bisect_right(self._expiries, now) :]
+
+    def next_expiry(self, now: datetime | None = None) -> datetime | None:
+        """Return when the next active alert expires, if any does."""
+        now = now or datetime.now(UTC)
+        index = bisect_right(self._expiries, now)
+        if index < len(self._expiries) and self._expiries[index] != _NEVER:
+            return self._expiries[index]
+        return None
+
+    def summary(self, now: datetime | None = None) -> list[dict[str, Any]]:
+        """Return the compact summary of each active alert."""
+        return [
+            {key: properties.get(key) for key in SUMMARY_KEYS}
+            for _, properties in self.active(now)
+        ]
+
+    def details(self, now: datetime | None = None) -> dict[str, dict[str, Any]]:
+        """Return the long-form text of each active alert, keyed by id."""
+        return {
+            alert_id: {key: properties.get(key) for key in DETAIL_KEYS}
+            for alert_id, properties in self.active(now)
+        }
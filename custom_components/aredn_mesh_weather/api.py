@@ -0,0 +1,499 @@
+"""Client for fetching AREDN Mesh Weather data from mesh nodes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+import zlib
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .breaker import BreakerState, CircuitBreaker, LatencyTracker
+from .connection import ArednMeshWeatherConnectionPool, ConnectionStats
+from .const import (
+    DATA_NODES,
+    EXECUTOR_PARSE_THRESHOLD,
+    MAX_BODY_SIZE,
+    MAX_CONCURRENT_FETCHES,
+    MAX_DECODED_SIZE,
+    READ_CHUNK_SIZE,
+    SEED_MAX_AGE,
+)
+from .history import OBSERVED_FIELDS, ObservationHistory
+from .parser import ArednMeshWeatherData, InvalidData, decode_payload
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from multidict import CIMultiDictProxy
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli else "gzip, deflate"
+_DECOMPRESS_ERRORS = (zlib.error, brotli.error) if brotli else (zlib.error,)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Content types a node may label its data with; bodies of other types, such
+# as a proxy's HTML error page, are not read
+_DATA_CONTENT_TYPES = frozenset({"application/json", "text/json", "text/plain"})
+
+
+class BodyRejected(InvalidData):
+    """Raised when a response body is not read, or not read in full."""
+
+    def __init__(self, message: str, received: int = 0) -> None:
+        """Initialize with the number of bytes read before giving up."""
+        super().__init__(message)
+        self.received = received
+
+
+async def async_read_body(
+    response: aiohttp.ClientResponse, max_size: int = MAX_BODY_SIZE
+) -> bytes:
+    """
+    Read a response body in chunks, up to ``max_size`` bytes.
+
+    Bodies of an unexpected content type are not read at all, and reading
+    stops as soon as the limit is passed. Leaving the rest unread closes the
+    connection.
+    """
+    if (
+        hdrs.CONTENT_TYPE in response.headers
+        and response.content_type not in _DATA_CONTENT_TYPES
+        and not response.content_type.endswith("+json")
+    ):
+        msg = f"Unexpected content type '{response.content_type}'"
+        raise BodyRejected(msg)
+    if (response.content_length or 0) > max_size:
+        msg = (
+            f"Response body of {response.content_length} bytes is over "
+            f"the limit of {max_size}"
+        )
+        raise BodyRejected(msg)
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            msg = f"Response body is over the limit of {max_size} bytes"
+            raise BodyRejected(msg, size)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _inflate(body: bytes, wbits: int, max_size: int) -> bytes:
+    """Decompress zlib-format data, giving up once past ``max_size`` bytes."""
+    decompressor = zlib.decompressobj(wbits)
+    decoded = decompressor.decompress(body, max_size + 1)
+    if len(decoded) > max_size:
+        msg = f"Response body decodes to over {max_size} bytes"
+        raise InvalidData(msg)
+    if not decompressor.eof:
+        msg = "Incomplete or truncated stream"
+        raise zlib.error(msg)
+    return decoded
+
+
+def decompress_body(
+    body: bytes, encoding: str, max_size: int = MAX_DECODED_SIZE
+) -> bytes:
+    """Decode a response body according to its Content-Encoding."""
+    encoding = encoding.strip().lower()
+    try:
+        if encoding in ("", "identity"):
+            return body
+        if encoding in ("gzip", "x-gzip"):
+            return _inflate(body, 16 + zlib.MAX_WBITS, max_size)
+        if encoding == "deflate":
+            # Some servers send raw deflate data without the zlib header
+            try:
+                return _inflate(body, zlib.MAX_WBITS, max_size)
+            except zlib.error:
+                return _inflate(body, -zlib.MAX_WBITS, max_size)
+        if encoding == "br" and brotli:
+            # brotli cannot stop early, so the limit applies afterwards
+            decoded = brotli.decompress(body)
+            if len(decoded) > max_size:
+                msg = f"Response body decodes to over {max_size} bytes"
+                raise InvalidData(msg)
+            return decoded
+    except _DECOMPRESS_ERRORS as exc:
+        msg = f"Corrupt {encoding} response body"
+        raise InvalidData(msg) from exc
+    msg = f"Unsupported content encoding '{encoding}'"
+    raise InvalidData(msg)
+
+
+def parse_body(
+    body: bytes, encoding: str, *, materialize: bool = False
+) -> tuple[int, dict[str, Any], ArednMeshWeatherData]:
+    """
+    Decompress, decode and parse a response body; also return its decoded size.
+
+    With ``materialize`` the lazily parsed sections are parsed too, for when
+    this runs in the executor.
+    """
+    decoded = decompress_body(body, encoding)
+    payload = decode_payload(decoded)
+    data = ArednMeshWeatherData.from_dict(payload)
+    if materialize:
+        data.materialize()
+    return len(decoded), payload, data
+
+
+def node_key(url: str, address: str | None = None) -> str:
+    """
+    Return a normalized form of ``url`` identifying the node it points at.
+
+    The scheme and host are lowercased and the port made explicit. When
+    ``address`` is given it replaces the host, so aliases of the same node
+    share a key.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = address or (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    port = parts.port or _DEFAULT_PORTS.get(scheme)
+    netloc = f"{host}:{port}" if port else host
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+async def async_resolve_node_key(hass: HomeAssistant, url: str) -> str:
+    """Return the node key for ``url`` with its host resolved to an address."""
+    parts = urlsplit(url)
+    if not parts.hostname:
+        return node_key(url)
+    try:
+        infos = await hass.loop.getaddrinfo(
+            parts.hostname, parts.port, type=socket.SOCK_STREAM
+        )
+    except OSError as err:
+        _LOGGER.debug("Could not resolve %s: %s", parts.hostname, err)
+        return node_key(url)
+    return node_key(url, min(info[4][0] for info in infos))
+
+
+class ArednMeshWeatherNode:
+    """Fetches and parses data from one mesh node, shared by its config entries."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pool: ArednMeshWeatherConnectionPool,
+        url: str,
+        fetch_slots: asyncio.Semaphore,
+    ) -> None:
+        """Initialize the node client."""
+        self.hass = hass
+        self.pool = pool
+        self.url = url
+        self._fetch_slots = fetch_slots
+        self.data: ArednMeshWeatherData | None = None
+        self.payload: dict[str, Any] | None = None
+        self._fetched_at: float | None = None
+        self._inflight: asyncio.Task[ArednMeshWeatherData] | None = None
+
+        # Cache validators from the last successful response
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+
+        # Bandwidth accounting, in bytes as sent on the wire and after decoding
+        self.last_bytes_received = 0
+        self.last_bytes_decoded = 0
+        self.total_bytes_received = 0
+
+        # Larger response bodies are abandoned part way through
+        self.max_body_size = MAX_BODY_SIZE
+
+        # Payloads this large are parsed in the executor, judged before
+        # decompression by the decoded size of the last payload parsed. Time
+        # spent on the event loop handling the last response, and whether it
+        # was offloaded.
+        self.parse_threshold = EXECUTOR_PARSE_THRESHOLD
+        self._payload_size = 0
+        self._loop_time: float | None = None
+        self.last_parse_offloaded = False
+
+        # How this node's requests obtained their connections
+        self.connection_stats = ConnectionStats()
+
+        # Reachability tracking, used to back off from dead nodes and size timeouts
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyTracker()
+
+        # Recent current observations, for trends
+        self.history = ObservationHistory()
+
+    async def async_fetch(self, max_age: float = 0) -> ArednMeshWeatherData:
+        """
+        Return the node's data, fetching it unless it is under ``max_age`` seconds old.
+
+        Concurrent callers share a single in-flight request. While the circuit
+        breaker is open no request is made and UpdateFailed is raised at once.
+        """
+        if (
+            self.data is not None
+            and self._fetched_at is not None
+            and self.hass.loop.time() - self._fetched_at < max_age
+        ):
+            return self.data
+
+        if self._inflight is None:
+            now = time.time()
+            if not self.breaker.allow_request(now):
+                msg = (
+                    f"{self.url} is unreachable, retrying in "
+                    f"{self.breaker.retry_at - now:.0f} s"
+                )
+                raise UpdateFailed(msg)
+            self._inflight = self.hass.async_create_task(
+                self._async_fetch(), f"{__name__} fetch {self.url}"
+            )
+            self._inflight.add_done_callback(self._clear_inflight)
+        return await asyncio.shield(self._inflight)
+
+    @property
+    def fetched_at(self) -> float | None:
+        """Return the loop time the current data was fetched, if there is any."""
+        return self._fetched_at
+
+    @property
+    def last_loop_time(self) -> float | None:
+        """
+        Return the seconds the last response has held the event loop.
+
+        Sections of an inline parse are parsed as they are first read, so the
+        time spent on them so far is included.
+        """
+        if self._loop_time is None or self.last_parse_offloaded:
+            return self._loop_time
+        return self._loop_time + self.data.parse_time
+
+    def _clear_inflight(self, _task: asyncio.Task[ArednMeshWeatherData]) -> None:
+        """Forget the finished request."""
+        self._inflight = None
+
+    async def _async_fetch(self) -> ArednMeshWeatherData:
+        """Fetch data from the node."""
+        headers = {hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+        validated = False
+        if self.data is not None:
+            if self._etag:
+                headers[hdrs.IF_NONE_MATCH] = self._etag
+                validated = True
+            if self._last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+                validated = True
+
+        try:
+            status, response_headers, body = await self._async_request(headers)
+            if status == HTTPStatus.NOT_MODIFIED and validated:
+                _LOGGER.debug("Data from %s not modified", self.url)
+                self._record_transfer(len(body), 0)
+                self._fetched_at = self.hass.loop.time()
+                return self.data
+
+            if status != HTTPStatus.OK:
+                msg = f"Error fetching data: HTTP {status}"
+                raise UpdateFailed(msg)
+
+            # The decoded size is not known until decompressed, but payloads
+            # from a node vary little, so go by the last one parsed
+            encoding = response_headers.get(hdrs.CONTENT_ENCODING, "")
+            offload = max(len(body), self._payload_size) >= self.parse_threshold
+            if offload:
+                parsed = await self.hass.async_add_executor_job(
+                    partial(parse_body, body, encoding, materialize=True)
+                )
+                start = time.perf_counter()
+            else:
+                start = time.perf_counter()
+                parsed = parse_body(body, encoding)
+            decoded_size, payload, data = parsed
+            self._record_transfer(len(body), decoded_size)
+            self._payload_size = decoded_size
+            self.record_observation(data)
+            self._loop_time = time.perf_counter() - start
+            self.last_parse_offloaded = offload
+            self.data = data
+            self.payload = payload
+            self._fetched_at = self.hass.loop.time()
+
+            self._etag = response_headers.get(hdrs.ETAG)
+            self._last_modified = response_headers.get(hdrs.LAST_MODIFIED)
+
+        except (aiohttp.ClientError, TimeoutError) as err:
+            msg = f"Error communicating with API: {err}"
+            raise UpdateFailed(msg) from err
+        except (ValueError, KeyError, InvalidData) as err:
+            msg = f"Invalid data received from API: {err}"
+            raise UpdateFailed(msg) from err
+        else:
+            return self.data
+
+    async def _async_request(
+        self, headers: dict[str, str]
+    ) -> tuple[int, CIMultiDictProxy[str], bytes]:
+        """Make one request to the node, tracking its latency and reachability."""
+        async with self._fetch_slots:
+            timeout = self.latency.timeout
+            start = self.hass.loop.time()
+            try:
+                async with self.pool.session.get(
+                    self.url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    auto_decompress=False,
+                    trace_request_ctx=self.connection_stats,
+                ) as response:
+                    body = (
+                        await self._async_read_body(response)
+                        if response.status == HTTPStatus.OK
+                        else b""
+                    )
+            except (aiohttp.ClientError, TimeoutError, InvalidData):
+                self._record_failure()
+                raise
+            latency = self.hass.loop.time() - start
+
+        if response.status not in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+            self._record_failure()
+        else:
+            if self.breaker.state is not BreakerState.CLOSED:
+                _LOGGER.info("%s is reachable again", self.url)
+            self.breaker.record_success()
+            self.latency.record(latency)
+        return response.status, response.headers, body
+
+    async def _async_read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read a response body of up to ``max_body_size`` bytes, counting it."""
+        try:
+            return await async_read_body(response, self.max_body_size)
+        except BodyRejected as err:
+            self._record_transfer(err.received, 0)
+            raise
+
+    def _record_failure(self) -> None:
+        """Count a failed request against the circuit breaker."""
+        was_closed = self.breaker.state is BreakerState.CLOSED
+        now = time.time()
+        self.breaker.record_failure(now)
+        if self.breaker.state is BreakerState.OPEN:
+            _LOGGER.log(
+                logging.WARNING if was_closed else logging.DEBUG,
+                "%s failed %d times in a row, backing off for %.0f s",
+                self.url,
+                self.breaker.failures,
+                self.breaker.retry_at - now,
+            )
+
+    def seed(self, payload: dict[str, Any], fetched_at: float) -> None:
+        """Take a payload fetched elsewhere at loop time ``fetched_at`` as current."""
+        data = ArednMeshWeatherData.from_dict(payload)
+        self.record_observation(data)
+        self.data = data
+        self.payload = payload
+        self._fetched_at = fetched_at
+
+    def record_observation(self, data: ArednMeshWeatherData) -> None:
+        """Add the current observation to the history and attach its trends."""
+        # Naive node times are local to Home Assistant's time zone, which need
+        # not be the process's
+        self.history.append(
+            dt_util.as_utc(data.update_time).timestamp(),
+            {name: getattr(data, name) for name in OBSERVED_FIELDS},
+        )
+        data.trends = self.history.trends()
+
+    def _record_transfer(self, received: int, decoded: int) -> None:
+        """Record the bytes transferred by a request."""
+        self.last_bytes_received = received
+        self.last_bytes_decoded = decoded
+        self.total_bytes_received += received
+
+
+class ArednMeshWeatherNodeRegistry:
+    """Domain-wide registry sharing one node client among config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._nodes: dict[str, ArednMeshWeatherNode] = {}
+        self._users: dict[str, set[str]] = {}
+        # Bounds the requests in flight across all nodes, which often share
+        # the same RF hops
+        self._fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        # Created with the first node client and closed with the last
+        self.pool: ArednMeshWeatherConnectionPool | None = None
+        # Payloads from config flow probes by URL, with the loop time of the fetch
+        self._seeds: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def add_seed(self, url: str, payload: dict[str, Any]) -> None:
+        """Keep a payload just fetched from ``url`` for a new entry's first refresh."""
+        now = self.hass.loop.time()
+        max_age = SEED_MAX_AGE.total_seconds()
+        self._seeds = {
+            seed_url: seed
+            for seed_url, seed in self._seeds.items()
+            if now - seed[0] < max_age
+        }
+        self._seeds[url] = (now, payload)
+
+    async def async_acquire(self, entry_id: str, url: str) -> ArednMeshWeatherNode:
+        """Return the node client for ``url``, registering ``entry_id`` as a user."""
+        key = await async_resolve_node_key(self.hass, url)
+        if key not in self._nodes:
+            if self.pool is None:
+                self.pool = ArednMeshWeatherConnectionPool(self.hass)
+            self._nodes[key] = ArednMeshWeatherNode(
+                self.hass, self.pool, url, self._fetch_slots
+            )
+            self._users[key] = set()
+        elif entry_id not in self._users[key]:
+            _LOGGER.debug("Sharing fetches from %s with %s", url, self._nodes[key].url)
+        self._users[key].add(entry_id)
+
+        node = self._nodes[key]
+        if (seed := self._seeds.pop(url, None)) and node.data is None:
+            fetched_at, payload = seed
+            if self.hass.loop.time() - fetched_at < SEED_MAX_AGE.total_seconds():
+                _LOGGER.debug("Using the payload from setup as the first data")
+                node.seed(payload, fetched_at)
+        return node
+
+    def release(self, entry_id: str) -> None:
+        """Unregister ``entry_id`` and drop node clients nobody uses."""
+        for key, users in list(self._users.items()):
+            users.discard(entry_id)
+            if not users:
+                del self._users[key]
+                del self._nodes[key]
+        if not self._nodes and self.pool is not None:
+            self.hass.async_create_task(self.pool.async_close())
+            self.pool = None
+
+
+def async_get_node_registry(hass: HomeAssistant) -> ArednMeshWeatherNodeRegistry:
+    """Return the domain-wide node registry, creating it on first use."""
+    if DATA_NODES not in hass.data:
+        hass.data[DATA_NODES] = ArednMeshWeatherNodeRegistry(hass)
+    return hass.data[DATA_NODES]
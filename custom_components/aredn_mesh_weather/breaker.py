@@ -0,0 +1,105 @@
+"""Circuit breaker and adaptive timeouts for polling mesh nodes."""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from enum import StrEnum
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop polling an unreachable node and probe it with exponential backoff.
+
+    After ``threshold`` consecutive failures the breaker opens and refuses
+    requests for a backoff period, doubling from ``base`` up to ``cap`` seconds
+    with random jitter. Once that passes a single trial request is let through
+    (half-open). Any success closes the breaker and resets the backoff.
+    Times are wall-clock seconds, as from ``time.time()``.
+    """
+
+    def __init__(self, threshold: int = 3, base: float = 60, cap: float = 1800) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.base = base
+        self.cap = cap
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at: float | None = None
+        self._opened = 0
+
+    def allow_request(self, now: float) -> bool:
+        """Return whether a request may be made now."""
+        if self.state is BreakerState.OPEN and now >= self.retry_at:
+            self.state = BreakerState.HALF_OPEN
+        return self.state is not BreakerState.OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = None
+        self._opened = 0
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed request, opening the breaker if needed."""
+        self.failures += 1
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self.threshold:
+            backoff = min(self.base * 2**self._opened, self.cap)
+            self._opened += 1
+            self.state = BreakerState.OPEN
+            self.retry_at = now + backoff * random.uniform(0.5, 1)  # noqa: S311
+
+
+class LatencyTracker:
+    """
+    Derive a request timeout from recently observed latencies.
+
+    The timeout is ``factor`` times the 90th percentile of the last ``window``
+    successful requests, clamped to ``[minimum, maximum]``. Until ``min_samples``
+    have been seen, ``default`` is used.
+    """
+
+    window = 20
+    min_samples = 5
+
+    def __init__(
+        self,
+        default: float = 10,
+        minimum: float = 3,
+        maximum: float = 30,
+        factor: float = 4,
+    ) -> None:
+        """Initialize the tracker."""
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.samples: deque[float] = deque(maxlen=self.window)
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful request, in seconds."""
+        self.samples.append(latency)
+
+    @property
+    def p90(self) -> float | None:
+        """Return the 90th percentile latency, if there are enough samples."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout to use for the next request, in seconds."""
+        if (p90 := self.p90) is None:
+            return self.default
+        return min(max(p90 * self.factor, self.minimum), self.maximum)
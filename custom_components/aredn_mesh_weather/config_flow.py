@@ -7,55 +7,164 @@ from typing import Any
 
 import aiohttp
 import voluptuous as vol
-
-from homeassistant.config_entries import ConfigFlow
-from homeassistant.const import CONF_URL
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlow,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_NAME, CONF_URL
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
+    TextSelectorType,
+)
+
+from .api import async_get_node_registry, async_read_body
+from .const import (
+    CONF_MIRRORS,
+    CONF_PARSE_THRESHOLD,
+    DEFAULT_URL,
+    DOMAIN,
+    EXECUTOR_PARSE_THRESHOLD,
+    MAX_DECODED_SIZE,
+)
+from .discovery import async_discover_nodes
+from .parser import ArednMeshWeatherData, InvalidData, decode_payload
 
-from .const import DEFAULT_URL, DOMAIN
-from .parser import InvalidData
+CONF_NODES = "nodes"
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_fetch_payload(hass: HomeAssistant, url: str) -> dict[str, Any]:
+    """
+    Fetch and check the payload of the node at ``url``.
+
+    Raises aiohttp.ClientError or TimeoutError if the node cannot be reached,
+    and InvalidData if it does not serve Mesh Weather data.
+    """
+    session = async_get_clientsession(hass)
+    async with session.get(url, timeout=10) as response:
+        response.raise_for_status()
+        # This session decompresses, so bound the decoded size
+        data = decode_payload(await async_read_body(response, MAX_DECODED_SIZE))
+    ArednMeshWeatherData.from_dict(data)
+    return data
+
+
 class ArednMeshWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for AREDN Mesh Weather."""
 
     VERSION = 1
     data_schema = vol.Schema({vol.Required(CONF_URL, default=DEFAULT_URL): str})
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        # Nodes found by scanning the mesh and not yet configured, names keyed by URL
+        self._discovered: dict[str, str] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(_config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow."""
+        return ArednMeshWeatherOptionsFlow()
+
     async def async_step_user(
+        self, _user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Let the user search the mesh or enter a node's URL."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Offer every weather node found on the mesh for setup."""
+        if user_input is not None and user_input[CONF_NODES]:
+            first, *others = user_input[CONF_NODES]
+            # A flow creates one entry, so set up the others in flows of their own
+            for url in others:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                        data={CONF_URL: url, CONF_NAME: self._discovered[url]},
+                    )
+                )
+            return await self.async_step_integration_discovery(
+                {CONF_URL: first, CONF_NAME: self._discovered[first]}
+            )
+
+        if not self._discovered:
+            nodes = await async_discover_nodes(
+                self.hass, async_get_clientsession(self.hass)
+            )
+            configured = self._async_current_ids()
+            self._discovered = {
+                node.url: node.name for node in nodes if node.url not in configured
+            }
+            if not self._discovered:
+                return self.async_abort(reason="no_nodes_found")
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NODES, default=list(self._discovered)
+                    ): cv.multi_select(self._discovered)
+                }
+            ),
+            errors={"base": "no_nodes_selected"} if user_input is not None else {},
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Set up a node the user picked in the scan step."""
+        url = discovery_info[CONF_URL]
+        await self.async_set_unique_id(url)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=discovery_info[CONF_NAME], data={CONF_URL: url}
+        )
+
+    async def async_step_manual(
         self, user_input: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        """Handle the initial step."""
+        """Handle setup of a node by URL."""
         errors: dict[str, Any] = {}
         if user_input is not None:
             url = user_input[CONF_URL]
             try:
-                session = async_get_clientsession(self.hass)
-                async with session.get(url, timeout=10) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                if data.get("status") != "ok" or "weather" not in data:
-                    raise InvalidData
+                data = await _async_fetch_payload(self.hass, url)
 
                 await self.async_set_unique_id(url)
                 self._abort_if_unique_id_configured(updates={CONF_URL: url})
 
+                # Spare the new entry from fetching the same data again
+                async_get_node_registry(self.hass).add_seed(url, data)
+
                 return self.async_create_entry(
                     title=data["geo"]["node"], data=user_input
                 )
             except (aiohttp.ClientError, TimeoutError) as err:
                 _LOGGER.warning("Failed to connect to '%s': %s", url, err)
                 return self.async_show_form(
-                    step_id="user",
+                    step_id="manual",
                     data_schema=self.data_schema,
                     errors={"base": "cannot_connect"},
                     description_placeholders={"error_details": str(err)},
                 )
             except InvalidData:
                 return self.async_show_form(
-                    step_id="user",
+                    step_id="manual",
                     data_schema=self.data_schema,
                     errors={"base": "invalid_data"},
                 )
@@ -64,7 +173,77 @@ class ArednMeshWeatherConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=self.data_schema,
             errors=errors,
         )
+
+
+class ArednMeshWeatherOptionsFlow(OptionsFlow):
+    """Handle options for an AREDN Mesh Weather entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Manage the URLs of nodes mirroring the entry's node, and parsing."""
+        errors: dict[str, str] = {}
+        placeholders = {"mirror": ""}
+        if user_input is not None:
+            url = self.config_entry.data[CONF_URL]
+            mirrors = list(
+                dict.fromkeys(
+                    mirror.strip()
+                    for mirror in user_input.get(CONF_MIRRORS, [])
+                    if mirror.strip() and mirror.strip() != url
+                )
+            )
+            # Mirrors added since the options were last saved must serve the data
+            known = self.config_entry.options.get(CONF_MIRRORS, [])
+            for mirror in mirrors:
+                if mirror in known:
+                    continue
+                try:
+                    await _async_fetch_payload(self.hass, mirror)
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    _LOGGER.warning("Failed to connect to '%s': %s", mirror, err)
+                    errors[CONF_MIRRORS] = "cannot_connect"
+                except InvalidData:
+                    errors[CONF_MIRRORS] = "invalid_data"
+                else:
+                    continue
+                placeholders["mirror"] = mirror
+                break
+            if not errors:
+                return self.async_create_entry(
+                    data={
+                        CONF_MIRRORS: mirrors,
+                        CONF_PARSE_THRESHOLD: int(user_input[CONF_PARSE_THRESHOLD]),
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                vol.Schema(
+                    {
+                        vol.Optional(CONF_MIRRORS): TextSelector(
+                            TextSelectorConfig(type=TextSelectorType.URL, multiple=True)
+                        ),
+                        vol.Required(
+                            CONF_PARSE_THRESHOLD,
+                            default=EXECUTOR_PARSE_THRESHOLD // 1024,
+                        ): NumberSelector(
+                            NumberSelectorConfig(
+                                min=0,
+                                step=1,
+                                unit_of_measurement="KiB",
+                                mode=NumberSelectorMode.BOX,
+                            )
+                        ),
+                    }
+                ),
+                user_input or self.config_entry.options,
+            ),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
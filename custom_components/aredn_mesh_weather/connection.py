@@ -0,0 +1,103 @@
+"""HTTP connection pool for polling mesh nodes."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from .const import (
+    CONNECTION_DNS_TTL,
+    CONNECTION_KEEPALIVE,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+)
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from homeassistant.core import Event, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectionStats:
+    """Counts of how requests obtained their connections."""
+
+    created: int = 0
+    reused: int = 0
+    dns_hits: int = 0
+    dns_misses: int = 0
+
+    @property
+    def reuse_rate(self) -> float | None:
+        """Return the percentage of connections reused, None before any request."""
+        total = self.created + self.reused
+        return round(100 * self.reused / total, 1) if total else None
+
+
+class ArednMeshWeatherConnectionPool:
+    """
+    HTTP session for polling nodes, apart from Home Assistant's shared one.
+
+    TCP setup and DNS lookups over RF links are a large part of a poll's
+    latency, so connections are kept alive from one poll to the next and mesh
+    names are resolved from the connector's cache. Request tracing counts how
+    connections were obtained, for the whole pool and for the ConnectionStats
+    a request passes as ``trace_request_ctx``.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.stats = ConnectionStats()
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._counter("created"))
+        trace.on_connection_reuseconn.append(self._counter("reused"))
+        trace.on_dns_cache_hit.append(self._counter("dns_hits"))
+        trace.on_dns_cache_miss.append(self._counter("dns_misses"))
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=CONNECTION_KEEPALIVE.total_seconds(),
+                ttl_dns_cache=int(CONNECTION_DNS_TTL.total_seconds()),
+            ),
+            headers={hdrs.USER_AGENT: SERVER_SOFTWARE},
+            trace_configs=[trace],
+        )
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    def _counter(self, field: str) -> Any:
+        """Return a trace callback incrementing ``field`` of the stats."""
+
+        async def on_signal(
+            _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+        ) -> None:
+            for stats in (self.stats, context.trace_request_ctx):
+                if isinstance(stats, ConnectionStats):
+                    setattr(stats, field, getattr(stats, field) + 1)
+
+        return on_signal
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        """Close the session as Home Assistant shuts down."""
+        self._unsub_close = None
+        await self.session.close()
+
+    async def async_close(self) -> None:
+        """Close the session and its connections."""
+        if self._unsub_close:
+            self._unsub_close()
+            self._unsub_close = None
+        _LOGGER.debug("Closing the connection pool: %s", self.stats)
+        await self.session.close()
@@ -1,9 +1,90 @@
 """Constants for the AREDN Mesh Weather integration."""
 
+from datetime import timedelta
+
 DOMAIN = "aredn_mesh_weather"
 
 DEFAULT_URL = "http://meshweather.local.mesh/?mode=data"
 
+# Option listing further URLs publishing the same data as the entry's URL
+CONF_MIRRORS = "mirrors"
+
+# Nodes refresh every DEFAULT_UPDATE_INTERVAL unless their data says otherwise.
+# Polls are timed to land POLL_MARGIN after the node is expected to refresh,
+# but never closer together than MIN_UPDATE_INTERVAL.
+DEFAULT_UPDATE_INTERVAL = timedelta(seconds=900)
+MIN_UPDATE_INTERVAL = timedelta(seconds=60)
+POLL_MARGIN = timedelta(seconds=30)
+
+# Entries are spread over POLL_SPREAD after that, each at a fixed offset
+# derived from its entry id, and at most MAX_CONCURRENT_FETCHES requests are
+# in flight across all nodes
+POLL_SPREAD = timedelta(seconds=120)
+MAX_CONCURRENT_FETCHES = 4
+
+# Payloads of at least this many bytes, decoded, are parsed in the executor
+# rather than on the event loop. The option sets it in KiB.
+CONF_PARSE_THRESHOLD = "parse_threshold"
+EXECUTOR_PARSE_THRESHOLD = 128 * 1024
+
+# Nodes are polled over a pool of their own. Idle connections are closed a
+# little before uhttpd, the web server of AREDN nodes, drops them after its
+# default 20 seconds, so a request never goes out on a connection the node has
+# closed. DNS lookups of mesh names are cached across the longest gap between
+# two polls of a node: its refresh interval, plus the margin and the widest
+# spread offset.
+CONNECTION_KEEPALIVE = timedelta(seconds=15)
+CONNECTION_DNS_TTL = DEFAULT_UPDATE_INTERVAL + POLL_MARGIN + POLL_SPREAD
+CONNECTION_LIMIT = 2 * MAX_CONCURRENT_FETCHES
+CONNECTION_LIMIT_PER_HOST = 2
+
+# With mirrors, a second one is raced once the first has taken
+# MIRROR_HEDGE_FACTOR times its typical latency, and at least
+# MIRROR_HEDGE_MIN_DELAY seconds. Another mirror replaces the current source
+# when its expected delivery time is under MIRROR_SWITCH_MARGIN of the
+# source's. Mirrors not yet heard from are assumed to take
+# MIRROR_UNKNOWN_LATENCY seconds. Every MIRROR_PROBE_EVERY fetches, one other
+# mirror is also fetched in the background to keep its score current.
+MIRROR_HEDGE_FACTOR = 2
+MIRROR_HEDGE_MIN_DELAY = 1.0
+MIRROR_SWITCH_MARGIN = 0.8
+MIRROR_UNKNOWN_LATENCY = 2.0
+MIRROR_PROBE_EVERY = 10
+
+# Response bodies are read READ_CHUNK_SIZE bytes at a time and abandoned once
+# over MAX_BODY_SIZE bytes, or over MAX_DECODED_SIZE bytes once decompressed
+READ_CHUNK_SIZE = 16 * 1024
+MAX_BODY_SIZE = 4 * 1024 * 1024
+MAX_DECODED_SIZE = 8 * 1024 * 1024
+
+# Storage for the last good payload, written at most every SNAPSHOT_SAVE_DELAY seconds
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+
+# hass.data key of the registry sharing node clients between config entries
+DATA_NODES = f"{DOMAIN}_nodes"
+
+# A payload fetched by the config flow serves as a new entry's first data if
+# it is younger than this
+SEED_MAX_AGE = timedelta(seconds=30)
+
+# Discovery reads the mesh's hosts and services from the local node, then
+# probes up to DISCOVERY_CONCURRENCY candidates at a time. Results are cached
+# in hass.data for DISCOVERY_CACHE_TTL.
+DISCOVERY_NODE_URL = "http://localnode.local.mesh"
+DISCOVERY_SYSINFO_PATH = "/cgi-bin/sysinfo.json?hosts=1&services=1"
+DISCOVERY_CONCURRENCY = 8
+DISCOVERY_TIMEOUT = 3
+DISCOVERY_CACHE_TTL = timedelta(minutes=5)
+DATA_DISCOVERY = f"{DOMAIN}_discovery"
+
+# Bus events fired when an NWS alert becomes active or expires
+EVENT_ALERT_ADDED = f"{DOMAIN}_alert_added"
+EVENT_ALERT_EXPIRED = f"{DOMAIN}_alert_expired"
+
+# Dispatcher signal sent after each poll, formatted with the config entry id
+SIGNAL_STATS_UPDATED = f"{DOMAIN}_stats_updated_{{}}"
+
 # Mapping from WMO weather codes to HA condition states
 # See: https://www.home-assistant.io/integrations/weather/#condition-mapping
 WMO_TO_HA_CONDITION = {
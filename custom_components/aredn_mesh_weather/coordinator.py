@@ -3,17 +3,42 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
-
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_URL
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .alerts import SUMMARY_KEYS
+from .api import ArednMeshWeatherNode, async_get_node_registry
+from .breaker import BreakerState
+from .const import (
+    CONF_MIRRORS,
+    CONF_PARSE_THRESHOLD,
+    DOMAIN,
+    EVENT_ALERT_ADDED,
+    EVENT_ALERT_EXPIRED,
+    MIN_UPDATE_INTERVAL,
+    POLL_MARGIN,
+    POLL_SPREAD,
+    SIGNAL_STATS_UPDATED,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .history import ObservationHistory
+from .mirrors import ArednMeshWeatherMirrors
 from .parser import ArednMeshWeatherData, InvalidData
+from .statistics import ArednMeshWeatherStatisticsImporter
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,42 +46,324 @@ _LOGGER = logging.getLogger(__name__)
 class ArednMeshWeatherCoordinator(DataUpdateCoordinator[ArednMeshWeatherData]):
     """AREDN Mesh Weather coordinator."""
 
+    node: ArednMeshWeatherNode
+    mirrors: ArednMeshWeatherMirrors
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.url = entry.data[CONF_URL]
-        self.session = async_get_clientsession(hass)
 
-        # Set a short initial update interval. This will be adjusted after the first successful fetch.
+        # Last successfully fetched payload, persisted so setup need not wait
+        # for the node
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.last_live_update: datetime | None = None
+        # Loop time at which the node fetched the data this entry has
+        self._data_fetched_at: float | None = None
+
+        # Hourly observation statistics, imported in bulk as the hours complete
+        self._statistics = ArednMeshWeatherStatisticsImporter(hass, entry)
+
+        # Sections changed by the last refresh, None to notify every listener
+        self._changed_sections: set[str] | None = None
+        # Whether the last update sent to listeners was of a successful refresh
+        self._notified_success = True
+        self.listener_updates_sent = 0
+        self.listener_updates_suppressed = 0
+
+        # Ids of the alerts announced on the bus as active, and the timer for
+        # the next one to expire
+        self._active_alerts: set[str] = set()
+        self._unsub_alert_expiry: CALLBACK_TYPE | None = None
+
+        # Fixed phase offset within POLL_SPREAD, so entries whose nodes share
+        # a refresh clock do not all poll at once. crc32 is stable across
+        # restarts, unlike hash().
+        self._poll_offset = POLL_SPREAD * (
+            zlib.crc32(entry.entry_id.encode()) / 0xFFFFFFFF
+        )
+
+        # Set a short initial update interval. After each fetch it is replaced by the
+        # delay until the node is expected to publish new data.
+        # Listeners are only notified when the data object changes, so a 304 does not
+        # trigger state writes.
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name="AREDN Mesh Weather",
-            update_interval=timedelta(seconds=60),
+            update_interval=MIN_UPDATE_INTERVAL,
+            always_update=False,
         )
 
+    async def _async_setup(self) -> None:
+        """
+        Attach to the shared clients for this entry's node and its mirrors.
+
+        Restoring the snapshot needs the node before the first refresh runs
+        this, so only the first call does anything.
+        """
+        if hasattr(self, "mirrors"):
+            return
+        registry = async_get_node_registry(self.hass)
+        entry_id = self.config_entry.entry_id
+        self.node = await registry.async_acquire(entry_id, self.url)
+        nodes = [self.node]
+        for url in self.config_entry.options.get(CONF_MIRRORS, []):
+            node = await registry.async_acquire(entry_id, url)
+            if node not in nodes:
+                nodes.append(node)
+        # Nodes are shared, so with entries disagreeing the last set up wins
+        if CONF_PARSE_THRESHOLD in self.config_entry.options:
+            for node in nodes:
+                node.parse_threshold = (
+                    self.config_entry.options[CONF_PARSE_THRESHOLD] * 1024
+                )
+        self.mirrors = ArednMeshWeatherMirrors(self.hass, nodes)
+
+    async def async_restore_snapshot(self) -> bool:
+        """
+        Seed the coordinator with the persisted snapshot, if there is one.
+
+        Returns whether data was restored. Until the next successful fetch,
+        ``last_live_update`` reflects when the snapshot was taken.
+        """
+        await self._async_setup()
+        if not (snapshot := await self._store.async_load()):
+            return False
+        try:
+            data = ArednMeshWeatherData.from_dict(snapshot["payload"])
+            fetched_at = dt_util.parse_datetime(snapshot["fetched_at"])
+            # Entries sharing the node each persist its history; the first
+            # one restored seeds it
+            if not self.node.history and "history" in snapshot:
+                self.node.history = ObservationHistory.from_dict(snapshot["history"])
+            # Alerts announced before the restart are not announced again.
+            # Snapshots from before they were persisted count those active
+            # in the restored data.
+            if "announced_alerts" in snapshot:
+                announced = set(snapshot["announced_alerts"])
+            else:
+                announced = {alert_id for alert_id, _ in data.alert_index.active()}
+        except (KeyError, TypeError, ValueError, InvalidData) as err:
+            _LOGGER.warning("Ignoring invalid snapshot for %s: %s", self.url, err)
+            return False
+        self._active_alerts = announced
+        self.node.record_observation(data)
+        self._async_import_statistics(data)
+
+        self.last_live_update = fetched_at
+        self._schedule_next_poll(data)
+        self.async_set_updated_data(data)
+        _LOGGER.debug("Restored data for %s fetched at %s", self.url, fetched_at)
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        """Return whether the data was fetched more than two node intervals ago."""
+        return (
+            self.last_live_update is None
+            or self.data is None
+            or dt_util.utcnow() - self.last_live_update > 2 * self.data.update_interval
+        )
+
+    @property
+    def data_age(self) -> float | None:
+        """Return how old the node's data was when last fetched, in seconds."""
+        if self.data is None or self.last_live_update is None:
+            return None
+        age = self.last_live_update - dt_util.as_utc(self.data.update_time)
+        return round(age.total_seconds())
+
     async def _async_update_data(self) -> ArednMeshWeatherData:
         """Fetch data from the AREDN Mesh Weather device."""
+        # Other entries for the same node may have fetched it since this one
+        # did; reuse their result if it is under half this poll's delay old.
+        max_age = self.update_interval.total_seconds() / 2
+        if self._data_fetched_at is not None:
+            max_age = min(max_age, self.hass.loop.time() - self._data_fetched_at)
+        # Left over if the last refresh changed nothing, so listeners were not called
+        self._changed_sections = None
+        try:
+            parsed_data = await self.mirrors.async_fetch(max_age)
+        except UpdateFailed:
+            nodes = self.mirrors.nodes
+            if all(node.breaker.state is BreakerState.OPEN for node in nodes):
+                # Sleep until a breaker lets a trial request through
+                retry_in = min(node.breaker.retry_at for node in nodes) - time.time()
+                self.update_interval = (
+                    max(timedelta(seconds=retry_in), MIN_UPDATE_INTERVAL)
+                    + self._poll_offset
+                )
+            self._async_notify_stats()
+            raise
+
+        if self.mirrors.source is not self.node:
+            # Keep the history, and so trends and statistics, with this entry's node
+            self.node.record_observation(parsed_data)
+
+        self._data_fetched_at = self.mirrors.source.fetched_at
+        self.last_live_update = dt_util.utcnow() - timedelta(
+            seconds=self.hass.loop.time() - self._data_fetched_at
+        )
         try:
-            async with self.session.get(self.url, timeout=10) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"Error fetching data: HTTP {response.status}")
-
-                data = await response.json()
-                parsed_data = ArednMeshWeatherData.from_dict(data)
-
-                # The API provides a recommended update interval.
-                # We'll use that, but ensure it's at least 60 seconds.
-                new_interval = max(parsed_data.update_interval, timedelta(seconds=60))
-                if (
-                    self.update_interval != new_interval
-                    and new_interval.total_seconds() > 0
-                ):
-                    self.update_interval = new_interval
-                    _LOGGER.info("Adjusting update interval to %s", new_interval)
-
-                return parsed_data
-
-        except (aiohttp.ClientError, TimeoutError) as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-        except (ValueError, KeyError, InvalidData) as err:
-            raise UpdateFailed(f"Invalid data received from API: {err}") from err
+            self._changed_sections = (
+                parsed_data.changed_sections(self.data)
+                if self.last_update_success
+                else None
+            )
+        except InvalidData as err:
+            msg = f"Invalid data received from API: {err}"
+            raise UpdateFailed(msg) from err
+        if parsed_data is not self.data:
+            self._async_save_snapshot()
+            self._async_import_statistics(parsed_data)
+        else:
+            # Listeners are not called for unchanged data, so update the
+            # diagnostics directly
+            self._async_notify_stats()
+
+        self._schedule_next_poll(parsed_data)
+        return parsed_data
+
+    def _schedule_next_poll(self, data: ArednMeshWeatherData) -> None:
+        """
+        Time the next poll to land just after the node publishes new data.
+
+        The node refreshes every ``update_interval``, counted from the time of
+        its current observation. If that moment has passed without new data the
+        node is running late, so check back after the minimum interval; once the
+        data is more than two intervals old, fall back to polling every interval.
+        Every poll is then shifted by this entry's phase offset.
+        """
+        interval = max(data.update_interval, MIN_UPDATE_INTERVAL)
+        now = dt_util.utcnow()
+        published = dt_util.as_utc(data.update_time)
+        expected = published + data.update_interval + POLL_MARGIN
+        if expected > now:
+            delay = expected - now
+        elif now - published < 2 * interval:
+            delay = MIN_UPDATE_INTERVAL
+        else:
+            delay = interval
+        self.update_interval = (
+            min(max(delay, MIN_UPDATE_INTERVAL), interval) + self._poll_offset
+        )
+        _LOGGER.debug("Next poll of %s in %s", self.url, self.update_interval)
+
+    @property
+    def suppression_rate(self) -> float | None:
+        """Return the percentage of listener updates skipped as unchanged."""
+        total = self.listener_updates_sent + self.listener_updates_suppressed
+        if not total:
+            return None
+        return round(100 * self.listener_updates_suppressed / total, 1)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update listeners whose sections changed.
+
+        Entities pass the set of sections they show as their listener context;
+        listeners without one are always updated.
+        """
+        changed, self._changed_sections = self._changed_sections, None
+        if self.last_update_success != self._notified_success:
+            # Availability changed, which every entity shows
+            self._notified_success = self.last_update_success
+            changed = None
+        if self.data is not None and (changed is None or "alerts" in changed):
+            self._async_announce_alerts()
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                self.listener_updates_sent += 1
+                update_callback()
+            else:
+                self.listener_updates_suppressed += 1
+
+    @callback
+    def _async_announce_alerts(self) -> None:
+        """Fire bus events for alerts that appeared or expired since last time."""
+        if self._unsub_alert_expiry:
+            self._unsub_alert_expiry()
+            self._unsub_alert_expiry = None
+
+        now = dt_util.utcnow()
+        index = self.data.alert_index
+        active = dict(index.active(now))
+        entry_id = self.config_entry.entry_id
+        for alert_id in active.keys() - self._active_alerts:
+            self.hass.bus.async_fire(
+                EVENT_ALERT_ADDED,
+                {"entry_id": entry_id}
+                | {key: active[alert_id].get(key) for key in SUMMARY_KEYS},
+            )
+        for alert_id in self._active_alerts - active.keys():
+            self.hass.bus.async_fire(
+                EVENT_ALERT_EXPIRED, {"entry_id": entry_id, "id": alert_id}
+            )
+        if self._active_alerts != active.keys():
+            self._active_alerts = set(active)
+            self._async_save_snapshot()
+
+        if next_expiry := index.next_expiry(now):
+            self._unsub_alert_expiry = async_track_point_in_utc_time(
+                self.hass, self._async_alert_expired, next_expiry
+            )
+
+    @callback
+    def _async_alert_expired(self, _now: datetime) -> None:
+        """Refresh the entities showing alerts when one expires between polls."""
+        self._unsub_alert_expiry = None
+        self._changed_sections = {"alerts"}
+        self.async_update_listeners()
+
+    @callback
+    def _async_import_statistics(self, data: ArednMeshWeatherData) -> None:
+        """Import statistics for the hours of history completed since last time."""
+        if rows := self._statistics.async_import(self.node.history, data):
+            _LOGGER.debug("Imported %d hourly statistics for %s", rows, self.url)
+
+    def _async_notify_stats(self) -> None:
+        """Tell diagnostic sensors that a poll has completed."""
+        async_dispatcher_send(
+            self.hass, SIGNAL_STATS_UPDATED.format(self.config_entry.entry_id)
+        )
+
+    @property
+    def _has_snapshot(self) -> bool:
+        """Return whether there is fetched data to persist."""
+        return (
+            self.last_live_update is not None
+            and self.mirrors.source.payload is not None
+        )
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Persist the data and announced alerts after SNAPSHOT_SAVE_DELAY."""
+        if self._has_snapshot:
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "fetched_at": self.last_live_update.isoformat(),
+            "payload": self.mirrors.source.payload,
+            "history": self.node.history.as_dict(),
+            "announced_alerts": sorted(self._active_alerts),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, persist the snapshot and release the shared node client."""
+        if self._shutdown_requested:
+            return
+        await super().async_shutdown()
+        if self._unsub_alert_expiry:
+            self._unsub_alert_expiry()
+            self._unsub_alert_expiry = None
+        # Write now rather than after the delay, so a reload starts from the
+        # alerts just announced
+        if self._has_snapshot:
+            await self._store.async_save(self._snapshot())
+        async_get_node_registry(self.hass).release(self.config_entry.entry_id)
@@ -0,0 +1,245 @@
+"""Metrics derived from temperature, humidity and wind speed."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, fall back to plain Python
+    np = None
+
+# Magnus coefficients for dew point over water, in °C
+_MAGNUS_A = 17.625
+_MAGNUS_B = 243.04
+
+# Wind chill is defined at or below 50 °F in winds of at least 3 mph, and the
+# heat index at or above 80 °F. Outside those ranges both equal the temperature.
+_WIND_CHILL_MAX_F = 50.0
+_WIND_CHILL_MIN_MPH = 3.0
+_HEAT_INDEX_MIN_F = 80.0
+
+# Rothfusz regression for the heat index in °F, as powers of (t, rh)
+_HEAT_INDEX_TERMS = (
+    (-42.379, 0, 0),
+    (2.04901523, 1, 0),
+    (10.14333127, 0, 1),
+    (-0.22475541, 1, 1),
+    (-6.83783e-3, 2, 0),
+    (-5.481717e-2, 0, 2),
+    (1.22874e-3, 2, 1),
+    (8.5282e-4, 1, 2),
+    (-1.99e-6, 2, 2),
+)
+# The regression is lowered in dry air up to _DRY_MAX_F, most at _DRY_PEAK_F
+# and not at all _DRY_SPAN_F either side, and raised in humid air up to
+# _HUMID_MAX_F
+_DRY_MAX_HUMIDITY = 13
+_DRY_MAX_F = 112
+_DRY_PEAK_F = 95
+_DRY_SPAN_F = 17
+_HUMID_MIN_HUMIDITY = 85
+_HUMID_MAX_F = 87
+
+# NWS wind chill in °F: a + b*t - c*v + d*t*v, where v is mph to the power
+_WIND_CHILL_TERMS = (35.74, 0.6215, 35.75, 0.4275)
+_WIND_CHILL_POWER = 0.16
+
+# Humidex, from the vapour pressure in hPa at the dew point in kelvin above
+# _VAPOUR_REFERENCE hPa
+_KELVIN = 273.15
+_VAPOUR_TRIPLE_POINT = 273.16
+_VAPOUR_BASE = 6.11
+_VAPOUR_SCALE = 5417.753
+_VAPOUR_REFERENCE = 10
+_HUMIDEX_FACTOR = 0.5555
+
+# Metrics computed by derive(). All but humidex are in the unit of the input
+# temperature; humidex is a dimensionless index on the Celsius scale.
+METRICS = ("dew_point", "heat_index", "wind_chill", "humidex")
+
+
+def _to_fahrenheit(celsius: float) -> float:
+    return celsius * 1.8 + 32
+
+
+def _to_celsius(fahrenheit: float) -> float:
+    return (fahrenheit - 32) / 1.8
+
+
+def dew_point(celsius: float, humidity: float) -> float:
+    """Return the dew point in °C, by the Magnus formula."""
+    if not humidity > 0:
+        return math.nan
+    gamma = math.log(humidity / 100) + _MAGNUS_A * celsius / (_MAGNUS_B + celsius)
+    return _MAGNUS_B * gamma / (_MAGNUS_A - gamma)
+
+
+def _rothfusz(t: Any, rh: Any) -> Any:
+    """Return the heat index regression, for numbers or NumPy arrays."""
+    return sum(c * t**i * rh**j for c, i, j in _HEAT_INDEX_TERMS)
+
+
+def _dry_adjustment(t: Any, rh: Any, sqrt: Callable[[Any], Any]) -> Any:
+    return (
+        (_DRY_MAX_HUMIDITY - rh)
+        / 4
+        * sqrt((_DRY_SPAN_F - abs(t - _DRY_PEAK_F)) / _DRY_SPAN_F)
+    )
+
+
+def _humid_adjustment(t: Any, rh: Any) -> Any:
+    return (rh - _HUMID_MIN_HUMIDITY) / 10 * (_HUMID_MAX_F - t) / 5
+
+
+def _wind_chill(t: Any, mph: Any) -> Any:
+    """Return the wind chill formula, for numbers or NumPy arrays."""
+    a, b, c, d = _WIND_CHILL_TERMS
+    v = mph**_WIND_CHILL_POWER
+    return a + b * t - c * v + d * t * v
+
+
+def _humidex(celsius: Any, dew_point_celsius: Any, exp: Callable[[Any], Any]) -> Any:
+    vapour = _VAPOUR_BASE * exp(
+        _VAPOUR_SCALE * (1 / _VAPOUR_TRIPLE_POINT - 1 / (_KELVIN + dew_point_celsius))
+    )
+    return celsius + _HUMIDEX_FACTOR * (vapour - _VAPOUR_REFERENCE)
+
+
+def heat_index(fahrenheit: float, humidity: float) -> float:
+    """Return the NWS heat index in °F."""
+    t, rh = fahrenheit, humidity
+    if not t >= _HEAT_INDEX_MIN_F:
+        return t
+    hi = _rothfusz(t, rh)
+    if rh < _DRY_MAX_HUMIDITY and t <= _DRY_MAX_F:
+        hi -= _dry_adjustment(t, rh, math.sqrt)
+    elif rh > _HUMID_MIN_HUMIDITY and t <= _HUMID_MAX_F:
+        hi += _humid_adjustment(t, rh)
+    return hi
+
+
+def wind_chill(fahrenheit: float, mph: float) -> float:
+    """Return the NWS wind chill in °F."""
+    if not (fahrenheit <= _WIND_CHILL_MAX_F and mph >= _WIND_CHILL_MIN_MPH):
+        return fahrenheit
+    return _wind_chill(fahrenheit, mph)
+
+
+def humidex(celsius: float, dew_point_celsius: float) -> float:
+    """Return the humidex from the temperature and dew point in °C."""
+    return _humidex(celsius, dew_point_celsius, math.exp)
+
+
+def derive_one(
+    temperature: float | None,
+    humidity: float | None,
+    wind_speed: float | None,
+    *,
+    fahrenheit: bool,
+) -> dict[str, float | None]:
+    """Return the metrics for a single observation, with None where unknown."""
+    values = [
+        math.nan if value is None else value
+        for value in (temperature, humidity, wind_speed)
+    ]
+    return {
+        name: None if math.isnan(column[0]) else column[0]
+        for name, column in _derive_python(
+            *(array("d", [value]) for value in values), fahrenheit=fahrenheit
+        ).items()
+    }
+
+
+def derive(
+    temperature: array, humidity: array, wind_speed: array, *, fahrenheit: bool
+) -> dict[str, array]:
+    """
+    Compute METRICS over whole columns at once.
+
+    Inputs are float arrays of equal length in the payload's units, with NaN
+    for missing values; wind speed is in mph. Each result is a float array of
+    the same length rounded to a tenth, NaN where it cannot be computed.
+    """
+    if np is not None:
+        return _derive_numpy(temperature, humidity, wind_speed, fahrenheit=fahrenheit)
+    return _derive_python(temperature, humidity, wind_speed, fahrenheit=fahrenheit)
+
+
+def _derive_python(
+    temperature: array, humidity: array, wind_speed: array, *, fahrenheit: bool
+) -> dict[str, array]:
+    """Compute METRICS one element at a time."""
+    results = {name: array("d") for name in METRICS}
+    for t, rh, mph in zip(temperature, humidity, wind_speed, strict=True):
+        t_f = t if fahrenheit else _to_fahrenheit(t)
+        t_c = _to_celsius(t) if fahrenheit else t
+        td_c = dew_point(t_c, rh)
+        hi_f = heat_index(t_f, rh)
+        wc_f = wind_chill(t_f, mph)
+        if fahrenheit:
+            td, hi, wc = _to_fahrenheit(td_c), hi_f, wc_f
+        else:
+            td, hi, wc = td_c, _to_celsius(hi_f), _to_celsius(wc_f)
+        results["dew_point"].append(round(td, 1))
+        results["heat_index"].append(round(hi, 1))
+        results["wind_chill"].append(round(wc, 1))
+        results["humidex"].append(round(humidex(t_c, td_c), 1))
+    return results
+
+
+def _abs_sqrt(values: Any) -> Any:
+    return np.sqrt(np.abs(values))
+
+
+def _derive_numpy(
+    temperature: array, humidity: array, wind_speed: array, *, fahrenheit: bool
+) -> dict[str, array]:
+    """Compute METRICS with vectorized NumPy operations."""
+    t = np.frombuffer(temperature, dtype=np.float64)
+    rh = np.frombuffer(humidity, dtype=np.float64)
+    mph = np.frombuffer(wind_speed, dtype=np.float64)
+    t_f = t if fahrenheit else t * 1.8 + 32
+    t_c = (t - 32) / 1.8 if fahrenheit else t
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gamma = np.log(np.where(rh > 0, rh, np.nan) / 100) + _MAGNUS_A * t_c / (
+            _MAGNUS_B + t_c
+        )
+        td_c = _MAGNUS_B * gamma / (_MAGNUS_A - gamma)
+
+        hi_f = _rothfusz(t_f, rh)
+        dry = (rh < _DRY_MAX_HUMIDITY) & (t_f <= _DRY_MAX_F)
+        # Where not dry the square root may be of a negative, so take it of
+        # the magnitude; that value is discarded
+        hi_f -= np.where(dry, _dry_adjustment(t_f, rh, _abs_sqrt), 0)
+        hi_f += np.where(
+            ~dry & (rh > _HUMID_MIN_HUMIDITY) & (t_f <= _HUMID_MAX_F),
+            _humid_adjustment(t_f, rh),
+            0,
+        )
+        hi_f = np.where(t_f >= _HEAT_INDEX_MIN_F, hi_f, t_f)
+
+        wc_f = np.where(
+            (t_f <= _WIND_CHILL_MAX_F) & (mph >= _WIND_CHILL_MIN_MPH),
+            _wind_chill(t_f, mph),
+            t_f,
+        )
+
+        hx = _humidex(t_c, td_c, np.exp)
+
+    if fahrenheit:
+        results = {"dew_point": td_c * 1.8 + 32, "heat_index": hi_f, "wind_chill": wc_f}
+    else:
+        results = {
+            "dew_point": td_c,
+            "heat_index": (hi_f - 32) / 1.8,
+            "wind_chill": (wc_f - 32) / 1.8,
+        }
+    results["humidex"] = hx
+    return {name: array("d", np.round(results[name], 1).tobytes()) for name in METRICS}
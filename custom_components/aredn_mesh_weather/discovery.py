@@ -0,0 +1,119 @@
+"""Discovery of Mesh Weather nodes on an AREDN mesh."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from .api import async_read_body
+from .const import (
+    DATA_DISCOVERY,
+    DISCOVERY_CACHE_TTL,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_NODE_URL,
+    DISCOVERY_SYSINFO_PATH,
+    DISCOVERY_TIMEOUT,
+    MAX_DECODED_SIZE,
+)
+from .parser import ArednMeshWeatherData, InvalidData, decode_payload
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts and services whose name contains this are probed
+_CANDIDATE_MARKER = "weather"
+
+
+@dataclass(frozen=True)
+class DiscoveredNode:
+    """A node that answered with Mesh Weather data."""
+
+    url: str
+    name: str
+
+
+def data_url(url: str) -> str:
+    """Return the Mesh Weather data URL served at the root of ``url``'s host."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme or "http", parts.netloc, "/", "mode=data", ""))
+
+
+def candidate_urls(sysinfo: dict[str, Any]) -> list[str]:
+    """Return the data URLs to probe, from an AREDN sysinfo.json response."""
+    urls: dict[str, None] = {}
+    for service in sysinfo.get("services") or []:
+        link = service.get("link") or ""
+        if link and _CANDIDATE_MARKER in f"{service.get('name')} {link}".lower():
+            urls[data_url(link)] = None
+    for host in sysinfo.get("hosts") or []:
+        name = host.get("name") or ""
+        if _CANDIDATE_MARKER in name.lower():
+            urls[data_url(f"http://{name.lower()}.local.mesh")] = None
+    return list(urls)
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, url: str, slots: asyncio.Semaphore
+) -> DiscoveredNode | None:
+    """Return the node at ``url`` if it serves Mesh Weather data."""
+    async with slots:
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=DISCOVERY_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                # Sessions passed in decompress, so bound the decoded size
+                data = decode_payload(await async_read_body(response, MAX_DECODED_SIZE))
+            ArednMeshWeatherData.from_dict(data)
+            return DiscoveredNode(url, data["geo"]["node"])
+        except (aiohttp.ClientError, TimeoutError, InvalidData, KeyError) as err:
+            _LOGGER.debug("No Mesh Weather node at %s: %s", url, err)
+            return None
+
+
+async def async_discover_nodes(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    node_url: str = DISCOVERY_NODE_URL,
+) -> list[DiscoveredNode]:
+    """
+    Return the Mesh Weather nodes on the mesh, as seen from ``node_url``.
+
+    The node's host and service lists give the candidates, which are probed
+    concurrently with short timeouts. Results are cached for a while, keyed
+    by ``node_url``.
+    """
+    cache: dict[str, tuple[float, list[DiscoveredNode]]] = hass.data.setdefault(
+        DATA_DISCOVERY, {}
+    )
+    now = hass.loop.time()
+    if (cached := cache.get(node_url)) and now - cached[0] < (
+        DISCOVERY_CACHE_TTL.total_seconds()
+    ):
+        return cached[1]
+
+    try:
+        async with session.get(
+            f"{node_url.rstrip('/')}{DISCOVERY_SYSINFO_PATH}",
+            timeout=aiohttp.ClientTimeout(total=DISCOVERY_TIMEOUT * 2),
+        ) as response:
+            response.raise_for_status()
+            sysinfo = decode_payload(await async_read_body(response, MAX_DECODED_SIZE))
+    except (aiohttp.ClientError, TimeoutError, InvalidData) as err:
+        _LOGGER.warning("Could not read the mesh topology from %s: %s", node_url, err)
+        return []
+
+    slots = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    found = await asyncio.gather(
+        *(_async_probe(session, url, slots) for url in candidate_urls(sysinfo))
+    )
+    nodes = [node for node in found if node is not None]
+    cache[node_url] = (now, nodes)
+    return nodes
@@ -0,0 +1,165 @@
+"""Rolling history of a node's current observations."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+# Observed quantities kept in the history, as ArednMeshWeatherData attributes
+OBSERVED_FIELDS = ("pressure", "temperature", "wind_gust_speed", "aqi")
+
+
+@dataclass(frozen=True)
+class Trends:
+    """Aggregates over the trailing window of an ObservationHistory."""
+
+    # Change in pressure since the window began, in hPa
+    pressure_tendency: float | None = None
+    # Rate of temperature change over the window, in degrees per hour
+    temperature_rate: float | None = None
+    # Highest gust observed within the window
+    wind_gust_peak: float | None = None
+
+
+class ObservationHistory:
+    """
+    Fixed-size ring buffer of observations with rolling aggregates.
+
+    Samples are kept in float arrays, oldest overwritten first. The window
+    reference is the newest sample at least ``window`` seconds older than the
+    latest, and only moves forward; gust peaks are tracked with a monotonic
+    queue. Each append is therefore amortized O(1), as is reading the trends.
+    """
+
+    def __init__(self, size: int = 256, window: float = 3 * 3600) -> None:
+        """Initialize an empty history."""
+        self.size = size
+        self.window = window
+        self._times = array("d", [math.nan]) * size
+        self._columns = {
+            name: array("d", [math.nan]) * size for name in OBSERVED_FIELDS
+        }
+        # Absolute sample numbers; sample n is stored at n % size
+        self._count = 0
+        self._reference: int | None = None
+        self._peaks: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._count, self.size)
+
+    def append(self, timestamp: float, values: dict[str, float | None]) -> bool:
+        """
+        Add an observation taken at ``timestamp`` (seconds since the epoch).
+
+        Observations no newer than the latest are ignored, so re-reading the
+        same data is harmless. Returns whether the sample was added.
+        """
+        if self._count and timestamp <= self._times[(self._count - 1) % self.size]:
+            return False
+
+        n = self._count
+        slot = n % self.size
+        self._times[slot] = timestamp
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[slot] = math.nan if value is None else value
+        self._count += 1
+
+        # The reference may have been overwritten if the buffer spans less
+        # than the window
+        oldest = self._count - len(self)
+        if self._reference is not None and self._reference < oldest:
+            self._reference = None
+        cutoff = timestamp - self.window
+        start = oldest if self._reference is None else self._reference
+        while start + 1 < n and self._times[(start + 1) % self.size] <= cutoff:
+            start += 1
+        if self._times[start % self.size] <= cutoff:
+            self._reference = start
+
+        gusts = self._columns["wind_gust_speed"]
+        if not math.isnan(gusts[slot]):
+            while self._peaks and gusts[self._peaks[-1] % self.size] <= gusts[slot]:
+                self._peaks.pop()
+            self._peaks.append(n)
+        floor = oldest if self._reference is None else self._reference + 1
+        while self._peaks and self._peaks[0] < floor:
+            self._peaks.popleft()
+        return True
+
+    def trends(self) -> Trends:
+        """Return the aggregates over the current window."""
+        if not self._count:
+            return Trends()
+        latest = (self._count - 1) % self.size
+        gusts = self._columns["wind_gust_speed"]
+        peak = gusts[self._peaks[0] % self.size] if self._peaks else None
+        if self._reference is None:
+            return Trends(wind_gust_peak=peak)
+
+        reference = self._reference % self.size
+        pressure = self._columns["pressure"]
+        temperature = self._columns["temperature"]
+        hours = (self._times[latest] - self._times[reference]) / 3600
+        return Trends(
+            pressure_tendency=_known(round(pressure[latest] - pressure[reference], 1)),
+            temperature_rate=_known(
+                round((temperature[latest] - temperature[reference]) / hours, 2)
+            ),
+            wind_gust_peak=peak,
+        )
+
+    def hourly(
+        self, name: str, since: float = 0
+    ) -> list[tuple[float, float, float, float]]:
+        """
+        Return ``(hour start, mean, min, max)`` of a field for each complete hour.
+
+        Only hours starting at or after ``since`` are included. The hour of the
+        latest sample is still in progress and is left out, as are hours with
+        no known value.
+        """
+        if not self._count:
+            return []
+        column = self._columns[name]
+        current_hour = self._times[(self._count - 1) % self.size] // 3600 * 3600
+        buckets: dict[float, list[float]] = {}
+        for n in range(self._count - 1, self._count - len(self) - 1, -1):
+            slot = n % self.size
+            hour = self._times[slot] // 3600 * 3600
+            if hour < since:
+                break
+            if hour < current_hour and not math.isnan(column[slot]):
+                buckets.setdefault(hour, []).append(column[slot])
+        return [
+            (hour, sum(values) / len(values), min(values), max(values))
+            for hour, values in sorted(buckets.items())
+        ]
+
+    def as_dict(self) -> dict[str, list[float | None]]:
+        """Return the samples oldest first, in a JSON-serializable form."""
+        order = range(self._count - len(self), self._count)
+        return {
+            name: [_known(column[n % self.size]) for n in order]
+            for name, column in (("time", self._times), *self._columns.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], **kwargs: Any) -> ObservationHistory:
+        """Rebuild a history from the output of as_dict()."""
+        history = cls(**kwargs)
+        # Fields added since the history was saved are missing throughout
+        missing = [None] * len(data["time"])
+        columns = (data.get(name, missing) for name in OBSERVED_FIELDS)
+        for timestamp, *values in zip(data["time"], *columns, strict=True):
+            history.append(timestamp, dict(zip(OBSERVED_FIELDS, values, strict=True)))
+        return history
+
+
+def _known(value: float) -> float | None:
+    """Return None in place of NaN."""
+    return None if math.isnan(value) else value
@@ -0,0 +1,196 @@
+"""Fetching from the best of several nodes publishing the same data."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .breaker import BreakerState
+from .const import (
+    MIRROR_HEDGE_FACTOR,
+    MIRROR_HEDGE_MIN_DELAY,
+    MIRROR_PROBE_EVERY,
+    MIRROR_SWITCH_MARGIN,
+    MIRROR_UNKNOWN_LATENCY,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import ArednMeshWeatherNode
+    from .parser import ArednMeshWeatherData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Weight of the latest outcome in the running success rate
+_SUCCESS_ALPHA = 0.2
+# Floor of the success rate when scoring, so a failing mirror is not infinitely bad
+_MIN_SUCCESS = 0.05
+
+
+@dataclass
+class MirrorScore:
+    """Running success rate of one mirror."""
+
+    success: float = 1.0
+
+    def record(self, *, ok: bool) -> None:
+        """Count the outcome of a fetch."""
+        self.success += _SUCCESS_ALPHA * (ok - self.success)
+
+
+class ArednMeshWeatherMirrors:
+    """
+    Fetches from an ordered list of nodes publishing the same data.
+
+    Each mirror is scored by its expected time to deliver data: its typical
+    latency divided by its success rate. The best one is asked first, and
+    the current source keeps its place unless another scores better by
+    MIRROR_SWITCH_MARGIN. If the answer takes much longer than usual, the next
+    mirror is raced against it and the first answer wins; a failure starts the
+    next mirror at once. A request that loses the race still completes in the
+    background, so its node's data and latency stay current. Mirrors that are
+    not being used are probed in turn, one fetch in MIRROR_PROBE_EVERY.
+    """
+
+    def __init__(self, hass: HomeAssistant, nodes: list[ArednMeshWeatherNode]) -> None:
+        """Initialize with the nodes in the configured order."""
+        self.hass = hass
+        self.nodes = nodes
+        self.scores = {node.url: MirrorScore() for node in nodes}
+        # The node the last data came from
+        self.source = nodes[0]
+        # Fetches answered by other than the first-ranked mirror, and mirrors
+        # started because the one asked before was slow
+        self.fallbacks = 0
+        self.races = 0
+        self._fetches = 0
+        self._probed = 0
+
+    def latency(self, node: ArednMeshWeatherNode) -> float:
+        """Return the typical latency of ``node``, in seconds."""
+        samples = sorted(node.latency.samples)
+        return samples[len(samples) // 2] if samples else MIRROR_UNKNOWN_LATENCY
+
+    def cost(self, node: ArednMeshWeatherNode) -> float:
+        """Return the expected time for ``node`` to deliver data; lower is better."""
+        success = max(self.scores[node.url].success, _MIN_SUCCESS)
+        return round(self.latency(node) / success, 3)
+
+    def ranked(self) -> list[ArednMeshWeatherNode]:
+        """Return the nodes best first, those backing off last."""
+        now = time.time()
+        ranked = sorted(
+            self.nodes,
+            key=lambda node: (
+                node.breaker.state is BreakerState.OPEN and node.breaker.retry_at > now,
+                self.cost(node),
+            ),
+        )
+        if (
+            self.source is not ranked[0]
+            and self.source.breaker.state is BreakerState.CLOSED
+            and self.cost(ranked[0]) > MIRROR_SWITCH_MARGIN * self.cost(self.source)
+        ):
+            ranked.remove(self.source)
+            ranked.insert(0, self.source)
+        return ranked
+
+    def hedge_delay(self, node: ArednMeshWeatherNode) -> float:
+        """Return how long to wait for ``node`` before racing another mirror."""
+        return max(MIRROR_HEDGE_MIN_DELAY, MIRROR_HEDGE_FACTOR * self.latency(node))
+
+    def _async_probe(self) -> None:
+        """Fetch the next mirror other than the source in the background."""
+        others = [node for node in self.nodes if node is not self.source]
+        node = others[self._probed % len(others)]
+        self._probed += 1
+        task = self.hass.async_create_task(
+            node.async_fetch(), f"{__name__} probe {node.url}"
+        )
+        task.add_done_callback(
+            lambda task: task.cancelled()
+            or self.scores[node.url].record(ok=task.exception() is None)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the scores and counters, for diagnostics."""
+        return {
+            "mirrors": {
+                node.url: {
+                    "cost": self.cost(node),
+                    "success_rate": round(self.scores[node.url].success, 3),
+                    "latency": self.latency(node),
+                }
+                for node in self.nodes
+            },
+            "fallbacks": self.fallbacks,
+            "races": self.races,
+        }
+
+    async def async_fetch(self, max_age: float = 0) -> ArednMeshWeatherData:
+        """Return data from the first mirror to deliver it."""
+        if len(self.nodes) == 1:
+            return await self.nodes[0].async_fetch(max_age)
+
+        # The first probe comes after MIRROR_PROBE_EVERY fetches
+        if self._fetches and self._fetches % MIRROR_PROBE_EVERY == 0:
+            self._async_probe()
+        self._fetches += 1
+
+        ranked = self.ranked()
+        waiting = iter(ranked)
+        pending: dict[asyncio.Task[ArednMeshWeatherData], ArednMeshWeatherNode] = {}
+        errors: list[str] = []
+
+        def start_next() -> ArednMeshWeatherNode | None:
+            if (node := next(waiting, None)) is not None:
+                task = self.hass.async_create_task(
+                    node.async_fetch(max_age), f"{__name__} fetch {node.url}"
+                )
+                pending[task] = node
+            return node
+
+        latest = start_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay(latest) if latest else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if (node := start_next()) is not None:
+                        _LOGGER.debug("%s is slow, racing %s", latest.url, node.url)
+                        self.races += 1
+                    latest = node
+                    continue
+
+                for task in done:
+                    node = pending.pop(task)
+                    try:
+                        data = task.result()
+                    except UpdateFailed as err:
+                        self.scores[node.url].record(ok=False)
+                        errors.append(f"{node.url}: {err}")
+                        latest = start_next() or latest
+                        continue
+                    self.scores[node.url].record(ok=True)
+                    if node is not ranked[0]:
+                        self.fallbacks += 1
+                    if node is not self.source:
+                        _LOGGER.info("Now using data from %s", node.url)
+                    self.source = node
+                    return data
+        finally:
+            # Requests already made go on in the background
+            for task in pending:
+                task.cancel()
+
+        msg = f"No mirror delivered data: {'; '.join(errors)}"
+        raise UpdateFailed(msg)
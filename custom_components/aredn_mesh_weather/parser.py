@@ -2,18 +2,382 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any
+import math
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Any
+
+from .alerts import AlertIndex
+from .const import DEFAULT_UPDATE_INTERVAL
+from .derived import derive, derive_one
+from .history import Trends
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+try:
+    from homeassistant.helpers.json import json_bytes_sorted
+    from homeassistant.util.json import json_loads
+except ImportError:  # Outside Home Assistant, e.g. when used standalone
+    import json
+    from json import loads as json_loads
+
+    def json_bytes_sorted(obj: Any) -> bytes:
+        """Dump JSON with sorted keys."""
+        return json.dumps(obj, sort_keys=True).encode()
+
+
+# Forecast columns as (field, payload key, integer-valued). Values are stored
+# in float arrays with NaN marking missing entries.
+DAILY_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("condition", "weathercode", True),
+    ("temperature", "temperature_2m_max", False),
+    ("templow", "temperature_2m_min", False),
+    ("precipitation", "precipitation_sum", False),
+    ("wind_speed", "wind_speed_10m_max", False),
+    ("wind_bearing", "wind_direction_10m_dominant", True),
+)
+HOURLY_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("condition", "weathercode", True),
+    ("temperature", "temperature_2m", False),
+    ("precipitation", "precipitation", False),
+    ("wind_speed", "wind_speed_10m", False),
+    ("wind_bearing", "wind_direction_10m", True),
+)
+# Hourly columns not every node publishes, left missing when absent
+HOURLY_OPTIONAL_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("humidity", "relative_humidity_2m", True),
+    ("wind_gust_speed", "wind_gusts_10m", False),
+)
+# Hourly air quality columns, joined onto the hourly forecast
+AIR_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("aqi", "us_aqi", True),
+    ("pm25", "pm2_5", False),
+)
+# Hours of forecast scanned for the air quality peak and the hourly outlook
+PEAK_HOURS = 24
+
+
+# Payload sections tracked for changes; entities subscribe to the ones they show
+SECTIONS = ("current", "daily", "hourly", "air", "alerts")
+
+# Types a forecast value may have; bool is an int but not a valid value
+_NUMBER_TYPES = frozenset({int, float, type(None)})
 
 
 class InvalidData(Exception):
     """Raised when the data is invalid."""
 
 
+def _lazy[T](method: Callable[[Any], T]) -> cached_property[T]:
+    """
+    Cache a section parsed on first access, timing the parse.
+
+    The time is added to the instance's ``parse_time``. Sections built while
+    building another are counted once, as part of the outer one. Malformed
+    sections raise InvalidData.
+    """
+
+    @wraps(method)
+    def timed(self: Any) -> T:
+        if self._parsing:
+            return method(self)
+        self._parsing = True
+        start = time.perf_counter()
+        try:
+            return method(self)
+        except (AttributeError, KeyError, TypeError, IndexError, ValueError) as exc:
+            msg = f"Malformed {method.__name__.lstrip('_')}"
+            raise InvalidData(msg) from exc
+        finally:
+            self._parsing = False
+            self.parse_time += time.perf_counter() - start
+
+    return cached_property(timed)
+
+
+def time_index(times: Sequence[str], moment: str) -> int:
+    """
+    Return the index of the first timestamp at or after ``moment``.
+
+    The payload's timestamps are zero-padded ISO 8601 strings in sorted order,
+    so they compare correctly as text. ``moment`` may be truncated to compare
+    at a coarser resolution, such as a date against daily entries.
+    """
+    return bisect_left(times, moment)
+
+
+def _check_numbers(key: str, values: Iterable[Any]) -> None:
+    """Check that a payload column holds only numbers and nulls."""
+    if not {type(value) for value in values} <= _NUMBER_TYPES:
+        msg = f"Column '{key}' has values that are not numbers"
+        raise TypeError(msg)
+
+
+def _keys(*fields: tuple[tuple[str, str, bool], ...]) -> tuple[str, ...]:
+    """Return the payload keys of forecast columns."""
+    return tuple(key for spec in fields for _, key, _ in spec)
+
+
+def _digest(
+    section: Mapping[str, Sequence[Any]], keys: Iterable[str], start: int
+) -> int:
+    """Return a hash of the columns ``keys`` of a payload section from ``start``."""
+    return hash(tuple(tuple(section.get(key, ())[start:]) for key in keys))
+
+
+def decode_payload(body: bytes) -> dict[str, Any]:
+    """Decode a raw response body without an intermediate text copy."""
+    try:
+        data = json_loads(body)
+    except ValueError as exc:
+        msg = "Response is not valid JSON"
+        raise InvalidData(msg) from exc
+    if not isinstance(data, dict):
+        msg = "Response is not a JSON object"
+        raise InvalidData(msg)
+    return data
+
+
+class ForecastSeries:
+    """Column-oriented forecast series backed by compact arrays."""
+
+    __slots__ = ("_columns", "_ints", "times")
+
+    def __init__(
+        self,
+        times: Sequence[str],
+        columns: dict[str, array],
+        ints: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize the series from already sliced columns."""
+        self.times = times
+        self._columns = columns
+        self._ints = ints
+
+    @classmethod
+    def from_payload(
+        cls,
+        section: Mapping[str, Sequence[Any]],
+        fields: tuple[tuple[str, str, bool], ...],
+        start: int = 0,
+        optional: tuple[tuple[str, str, bool], ...] = (),
+    ) -> ForecastSeries:
+        """
+        Slice the parallel arrays of a payload section from ``start``.
+
+        Keys of ``optional`` fields may be absent, giving an all-missing column.
+        """
+        times = section["time"][start:]
+        if not {type(moment) for moment in times} <= {str}:
+            msg = "Column 'time' has values that are not timestamps"
+            raise TypeError(msg)
+        columns: dict[str, array] = {}
+        for spec in (*fields, *optional):
+            name, key, _ = spec
+            if key not in section and spec in optional:
+                columns[name] = array("d", [math.nan]) * len(times)
+                continue
+            values = section[key][start : start + len(times)]
+            if len(values) != len(times):
+                msg = f"Column '{key}' is shorter than 'time'"
+                raise IndexError(msg)
+            _check_numbers(key, values)
+            columns[name] = array(
+                "d", [math.nan if value is None else value for value in values]
+            )
+        ints = frozenset(name for name, _, is_int in (*fields, *optional) if is_int)
+        return cls(times, columns, ints)
+
+    def join(
+        self,
+        section: Mapping[str, Sequence[Any]],
+        fields: tuple[tuple[str, str, bool], ...],
+    ) -> None:
+        """
+        Add the columns of another hourly section, matched to entries by hour.
+
+        Both time arrays are sorted, so one merge pass over them lines the rows
+        up. Entries the section has no value for are left missing. Only meant
+        to be called while the series is being built.
+        """
+        times = self.times
+        other_times = section.get("time") or []
+        sources = []
+        for name, key, _ in fields:
+            column = array("d", [math.nan]) * len(times)
+            self._columns[name] = column
+            values = section.get(key) or []
+            _check_numbers(key, values)
+            sources.append((column, values))
+        self._ints |= frozenset(name for name, _, is_int in fields if is_int)
+
+        i = 0
+        j = time_index(other_times, times[0][:13]) if times else 0
+        while i < len(times) and j < len(other_times):
+            hour = times[i][:13]
+            other_hour = other_times[j][:13]
+            if other_hour < hour:
+                j += 1
+            elif other_hour > hour:
+                i += 1
+            else:
+                for column, values in sources:
+                    if j < len(values) and values[j] is not None:
+                        column[i] = values[j]
+                i += 1
+                j += 1
+
+    def peak(self, name: str, count: int | None = None) -> tuple[Any, str] | None:
+        """Return the highest value of a column and its time in the first ``count``."""
+        column = self._columns[name]
+        limit = len(column) if count is None else min(count, len(column))
+        best = None
+        for i in range(limit):
+            if not math.isnan(column[i]) and (best is None or column[i] > column[best]):
+                best = i
+        if best is None:
+            return None
+        value = column[best]
+        return int(value) if name in self._ints else value, self.times[best]
+
+    def values(self, name: str) -> array:
+        """Return the float array backing a column, with NaN for missing entries."""
+        return self._columns[name]
+
+    def add_column(self, name: str, column: array) -> None:
+        """Add a float column, only while the series is being built."""
+        self._columns[name] = column
+
+    def digest(self) -> int:
+        """Return a hash of the series' contents."""
+        return hash(
+            (
+                tuple(self.times),
+                *(column.tobytes() for column in self._columns.values()),
+            )
+        )
+
+    def __len__(self) -> int:
+        """Return the number of forecast entries."""
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield one dict per entry, keyed by field name."""
+        keys = {"datetime": "datetime"} | {name: name for name in self._columns}
+        return self.rows(keys)
+
+    def column(self, name: str) -> list[Any]:
+        """Return a column as Python values, with None for missing entries."""
+        if name == "datetime":
+            return list(self.times)
+        as_int = name in self._ints
+        return [
+            None if math.isnan(value) else int(value) if as_int else value
+            for value in self._columns[name]
+        ]
+
+    def rows(
+        self,
+        keys: Mapping[str, str],
+        convert: Mapping[str, Callable[[Any], Any]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield one dict per entry, built only as it is consumed.
+
+        ``keys`` maps each output key to a field name (``datetime`` selects the
+        timestamps). ``convert`` optionally maps output keys to a function
+        applied to that column before rows are assembled.
+        """
+        convert = convert or {}
+        columns = []
+        for key, name in keys.items():
+            values = self.column(name)
+            if key in convert:
+                values = list(map(convert[key], values))
+            columns.append((key, values))
+        for i in range(len(self.times)):
+            yield {key: values[i] for key, values in columns}
+
+
+@dataclass(frozen=True)
+class HourlyOutlook:
+    """Figures automations ask of the hourly forecast, precomputed at parse time."""
+
+    # First forecast hour with any precipitation, and with the temperature at
+    # or below freezing
+    precipitation_start: datetime | None = None
+    freezing_start: datetime | None = None
+
+    # Extremes over the next PEAK_HOURS hours
+    temperature_max: float | None = None
+    temperature_min: float | None = None
+    wind_gust_max: float | None = None
+
+    @classmethod
+    def from_series(
+        cls, series: ForecastSeries, freezing: float, tz: tzinfo | None = None
+    ) -> HourlyOutlook:
+        """
+        Scan the hourly columns once.
+
+        The scan stops as soon as the extremes window has passed and both
+        onsets have been found. Forecast times are local to the node, so they
+        are given the time zone ``tz`` when it is known.
+        """
+        times = series.times
+        temperature = series.values("temperature")
+        precipitation = series.values("precipitation")
+        gust = series.values("wind_gust_speed")
+        rain_at = freeze_at = None
+        high = low = gust_max = math.nan
+        for i in range(len(times)):
+            t = temperature[i]
+            if i < PEAK_HOURS:
+                # NaN compares false, so a missing value never replaces a known one
+                if t > high or math.isnan(high):
+                    high = t
+                if t < low or math.isnan(low):
+                    low = t
+                if gust[i] > gust_max or math.isnan(gust_max):
+                    gust_max = gust[i]
+            elif rain_at is not None and freeze_at is not None:
+                break
+            if rain_at is None and precipitation[i] > 0:
+                rain_at = i
+            if freeze_at is None and t <= freezing:
+                freeze_at = i
+
+        def moment(index: int | None) -> datetime | None:
+            if index is None:
+                return None
+            return datetime.fromisoformat(times[index]).replace(tzinfo=tz)
+
+        def value(number: float) -> float | None:
+            return None if math.isnan(number) else number
+
+        return cls(
+            precipitation_start=moment(rain_at),
+            freezing_start=moment(freeze_at),
+            temperature_max=value(high),
+            temperature_min=value(low),
+            wind_gust_max=value(gust_max),
+        )
+
+
 @dataclass
 class ArednMeshWeatherData:
-    """AREDN Mesh Weather data."""
+    """
+    AREDN Mesh Weather data.
+
+    Current conditions are parsed up front. Forecasts, air quality and alerts
+    are kept as raw payload sections and parsed on first access, then cached
+    on the instance, so consumers of current conditions never pay for them.
+    """
 
     # Current weather
     condition_code: int | None
@@ -28,54 +392,236 @@ class ArednMeshWeatherData:
     wind_gust_speed: float | None
     precipitation: float | None
 
+    # Derived from current conditions, see derived.METRICS
+    dew_point: float | None
+    heat_index: float | None
+    wind_chill: float | None
+    humidex: float | None
+
+    # Meta
+    update_time: datetime
+    update_interval: timedelta
+
+    # Raw payload sections behind the lazily parsed attributes
+    current_section: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    daily_section: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    hourly_section: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    air_section: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    alerts_section: Mapping[str, Any] = field(default_factory=dict, repr=False)
+
+    # Filled in from the node's observation history once the data is accepted
+    trends: Trends = field(default_factory=Trends, compare=False)
+
+    # Seconds spent parsing lazy sections so far
+    parse_time: float = field(default=0.0, repr=False, compare=False)
+    _parsing: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def _now(self) -> str:
+        """Return the observation time as the payload formats it."""
+        return self.update_time.replace(tzinfo=None).isoformat(timespec="minutes")
+
     # Forecasts
-    forecast_daily: list[dict[str, Any]]
-    forecast_hourly: list[dict[str, Any]]
+
+    @_lazy
+    def forecast_daily(self) -> ForecastSeries:
+        """Return the daily forecast from today on."""
+        daily = self.daily_section
+        return ForecastSeries.from_payload(
+            daily, DAILY_FIELDS, time_index(daily["time"], self._now[:10])
+        )
+
+    @_lazy
+    def forecast_hourly(self) -> ForecastSeries:
+        """Return the hourly forecast from now on, with air quality and metrics."""
+        hourly = self.hourly_section
+        series = ForecastSeries.from_payload(
+            hourly,
+            HOURLY_FIELDS,
+            time_index(hourly["time"], self._now),
+            optional=HOURLY_OPTIONAL_FIELDS,
+        )
+        series.join(self.air_section.get("hourly", {}), AIR_FIELDS)
+        for name, column in derive(
+            series.values("temperature"),
+            series.values("humidity"),
+            series.values("wind_speed"),
+            fahrenheit=self._fahrenheit,
+        ).items():
+            series.add_column(name, column)
+        return series
+
+    @_lazy
+    def outlook(self) -> HourlyOutlook:
+        """Return the figures precomputed from the hourly forecast."""
+        return HourlyOutlook.from_series(
+            self.forecast_hourly,
+            32 if self._fahrenheit else 0,
+            self.update_time.tzinfo,
+        )
+
+    @property
+    def _fahrenheit(self) -> bool:
+        return self.temperature_unit == "°F"
 
     # Air Quality
-    aqi: int | None
-    pm25: float | None
+
+    @_lazy
+    def _current_air(self) -> tuple[int | None, float | None]:
+        """Return the AQI and PM2.5 of the current hour, if published."""
+        air_hourly = self.air_section.get("hourly", {})
+        if "time" not in air_hourly or "us_aqi" not in air_hourly:
+            return None, None
+        air_times = air_hourly["time"]
+        hour = self._now[:13]
+        air_index = time_index(air_times, hour)
+        if air_index < len(air_times) and air_times[air_index].startswith(hour):
+            try:
+                current = (
+                    air_hourly["us_aqi"][air_index],
+                    air_hourly["pm2_5"][air_index],
+                )
+            except (IndexError, KeyError):
+                pass  # No current AQI data
+            else:
+                _check_numbers("us_aqi", current)
+                return current
+        return None, None
+
+    @property
+    def aqi(self) -> int | None:
+        """Return the current AQI."""
+        return self._current_air[0]
+
+    @property
+    def pm25(self) -> float | None:
+        """Return the current PM2.5 concentration."""
+        return self._current_air[1]
+
+    @_lazy
+    def aqi_peak(self) -> tuple[int, str] | None:
+        """Return the highest AQI over the next PEAK_HOURS and its time."""
+        return self.forecast_hourly.peak("aqi", PEAK_HOURS)
+
+    @_lazy
+    def pm25_peak(self) -> tuple[float, str] | None:
+        """Return the highest PM2.5 over the next PEAK_HOURS and its time."""
+        return self.forecast_hourly.peak("pm25", PEAK_HOURS)
 
     # NWS Alerts
-    alerts: list[dict[str, Any]]
 
-    # Meta
-    update_time: datetime
-    update_interval: timedelta
+    @property
+    def alerts(self) -> list[dict[str, Any]]:
+        """Return the NWS alert features."""
+        return self.alerts_section.get("features", [])
+
+    @_lazy
+    def alert_index(self) -> AlertIndex:
+        """Return the alerts indexed by id and expiry."""
+        if not all(isinstance(feature, dict) for feature in self.alerts):
+            msg = "Alert features are not objects"
+            raise TypeError(msg)
+        return AlertIndex(self.alerts)
+
+    # Change detection
+
+    @_lazy
+    def digests(self) -> dict[str, int]:
+        """
+        Return a content hash of each of SECTIONS.
+
+        Forecasts are hashed from where they are sliced, so a section also
+        changes as the current day or hour moves on. Alerts are small and
+        nested, so they are hashed as JSON.
+        """
+        now = self._now
+        daily, hourly = self.daily_section, self.hourly_section
+        air_hourly = self.air_section.get("hourly", {})
+        air_start = time_index(air_hourly.get("time", ()), now[:13])
+        air = hash(
+            (now[:13], _digest(air_hourly, ("time", *_keys(AIR_FIELDS)), air_start))
+        )
+        return {
+            "current": hash(tuple(self.current_section.items())),
+            "daily": _digest(
+                daily,
+                ("time", *_keys(DAILY_FIELDS)),
+                time_index(daily["time"], now[:10]),
+            ),
+            "hourly": hash(
+                (
+                    _digest(
+                        hourly,
+                        ("time", *_keys(HOURLY_FIELDS, HOURLY_OPTIONAL_FIELDS)),
+                        time_index(hourly["time"], now),
+                    ),
+                    air,
+                    self.temperature_unit,
+                )
+            ),
+            "air": air,
+            "alerts": hash(json_bytes_sorted(self.alerts)),
+        }
+
+    def materialize(self) -> None:
+        """Parse every lazy section now, e.g. while still off the event loop."""
+        for name in (
+            "forecast_daily",
+            "forecast_hourly",
+            "outlook",
+            "_current_air",
+            "aqi_peak",
+            "pm25_peak",
+            "alert_index",
+            "digests",
+        ):
+            getattr(self, name)
+
+    def changed_sections(self, previous: ArednMeshWeatherData | None) -> set[str]:
+        """Return the sections whose content differs from ``previous``."""
+        if previous is None:
+            return set(SECTIONS)
+        return {
+            section
+            for section in SECTIONS
+            if self.digests.get(section) != previous.digests.get(section)
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ArednMeshWeatherData:
-        """Parse data from the API."""
+        """
+        Parse data from the API.
+
+        Only current conditions are parsed. The other sections are checked
+        when first parsed, raising InvalidData if malformed.
+        """
         try:
             if data.get("status") != "ok" or "weather" not in data:
-                raise InvalidData("Weather data not found or status not ok")
+                msg = "Weather data not found or status not ok"
+                raise InvalidData(msg)
 
             weather = data["weather"]
             current = weather["current"]
             daily = weather["daily"]
             hourly = weather["hourly"]
-            air = data.get("air", {})
-            air_hourly = air.get("hourly", {})
-            nws_alerts = data.get("nws_alerts", {})
-
-            # Find current hourly air quality index
-            now = datetime.fromisoformat(current["time"])
-            aqi = None
-            pm25 = None
-            if "time" in air_hourly and "us_aqi" in air_hourly:
-                try:
-                    current_air_index = air_hourly["time"].index(
-                        now.strftime("%Y-%m-%dT%H:00")
-                    )
-                    aqi = air_hourly["us_aqi"][current_air_index]
-                    pm25 = air_hourly["pm2_5"][current_air_index]
-                except (ValueError, IndexError):
-                    pass  # No current AQI data
+            update_time = datetime.fromisoformat(current["time"])
+            if update_time.tzinfo is None and "utc_offset_seconds" in weather:
+                update_time = update_time.replace(
+                    tzinfo=timezone(timedelta(seconds=weather["utc_offset_seconds"]))
+                )
+
+            temperature_unit = weather.get("current_units", {}).get("temperature_2m")
+            derived = derive_one(
+                current.get("temperature_2m"),
+                current.get("relative_humidity_2m"),
+                current.get("wind_speed_10m"),
+                fahrenheit=temperature_unit == "°F",
+            )
 
             return cls(
                 condition_code=current.get("weathercode"),
                 temperature=current.get("temperature_2m"),
-                temperature_unit=weather.get("current_units", {}).get("temperature_2m"),
+                temperature_unit=temperature_unit,
                 pressure=current.get("pressure_msl"),
                 humidity=current.get("relative_humidity_2m"),
                 wind_speed=current.get("wind_speed_10m"),
@@ -84,36 +630,18 @@ class ArednMeshWeatherData:
                 cloud_cover=current.get("cloudcover"),
                 wind_gust_speed=current.get("wind_gusts_10m"),
                 precipitation=current.get("precipitation"),
-                forecast_daily=[
-                    {
-                        "datetime": dt,
-                        "condition": daily["weathercode"][i],
-                        "temperature": daily["temperature_2m_max"][i],
-                        "templow": daily["temperature_2m_min"][i],
-                        "precipitation": daily["precipitation_sum"][i],
-                        "wind_speed": daily["wind_speed_10m_max"][i],
-                        "wind_bearing": daily["wind_direction_10m_dominant"][i],
-                    }
-                    for i, dt in enumerate(daily["time"])
-                    if datetime.fromisoformat(dt).date() >= now.date()
-                ],
-                forecast_hourly=[
-                    {
-                        "datetime": dt,
-                        "condition": hourly["weathercode"][i],
-                        "temperature": hourly["temperature_2m"][i],
-                        "precipitation": hourly["precipitation"][i],
-                        "wind_speed": hourly["wind_speed_10m"][i],
-                        "wind_bearing": hourly["wind_direction_10m"][i],
-                    }
-                    for i, dt in enumerate(hourly["time"])
-                    if datetime.fromisoformat(dt) >= now
-                ],
-                aqi=aqi,
-                pm25=pm25,
-                alerts=nws_alerts.get("features", []),
-                update_time=datetime.fromisoformat(current["time"]),
-                update_interval=timedelta(seconds=current.get("interval", 900)),
+                **derived,
+                update_time=update_time,
+                update_interval=(
+                    timedelta(seconds=current["interval"])
+                    if "interval" in current
+                    else DEFAULT_UPDATE_INTERVAL
+                ),
+                current_section=current,
+                daily_section=daily,
+                hourly_section=hourly,
+                air_section=data.get("air", {}),
+                alerts_section=data.get("nws_alerts", {}),
             )
-        except (KeyError, TypeError, IndexError) as exc:
+        except (AttributeError, KeyError, TypeError, IndexError, ValueError) as exc:
             raise InvalidData from exc
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,33 +11,180 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONCENTRATION_MICROGRAMS_PER_CUBIC_METER, UnitOfSpeed
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .breaker import BreakerState
+from .const import DOMAIN, SIGNAL_STATS_UPDATED
 from .coordinator import ArednMeshWeatherCoordinator
-from .parser import ArednMeshWeatherData
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .parser import ArednMeshWeatherData
 
 
 @dataclass(frozen=True, kw_only=True)
 class ArednMeshWeatherSensorEntityDescription(SensorEntityDescription):
     """Describes a AREDN Mesh Weather sensor entity."""
 
-    value_fn: Callable[[ArednMeshWeatherData], int | float | str | None]
+    value_fn: Callable[[ArednMeshWeatherData], int | float | str | datetime | None]
     attr_fn: Callable[[ArednMeshWeatherData], dict[str, Any]] | None = None
+    unit_fn: Callable[[ArednMeshWeatherData], str | None] | None = None
+    sections: frozenset[str] | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArednMeshWeatherDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a AREDN Mesh Weather diagnostic sensor entity."""
+
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    value_fn: Callable[
+        [ArednMeshWeatherCoordinator], int | float | str | datetime | None
+    ]
+    attr_fn: Callable[[ArednMeshWeatherCoordinator], dict[str, Any]] | None = None
+    # Diagnostics follow every poll, not particular sections of the data
+    sections: frozenset[str] | None = None
+
+
+def _temperature_unit(data: ArednMeshWeatherData) -> str:
+    """Return the node's temperature unit."""
+    if data.temperature_unit == "°F":
+        return UnitOfTemperature.FAHRENHEIT
+    return UnitOfTemperature.CELSIUS
+
+
+def _timestamp(moment: datetime | None) -> datetime | None:
+    """Return a forecast time as aware, taking it as local if the node gave no zone."""
+    if moment is None or moment.tzinfo is not None:
+        return moment
+    return dt_util.as_local(moment)
 
 
 SENSOR_TYPES: tuple[ArednMeshWeatherSensorEntityDescription, ...] = (
+    ArednMeshWeatherSensorEntityDescription(
+        key="dew_point",
+        translation_key="dew_point",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        unit_fn=_temperature_unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.dew_point,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="heat_index",
+        translation_key="heat_index",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        unit_fn=_temperature_unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.heat_index,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="wind_chill",
+        translation_key="wind_chill",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        unit_fn=_temperature_unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.wind_chill,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="humidex",
+        translation_key="humidex",
+        icon="mdi:sun-thermometer",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.humidex,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="pressure_tendency",
+        translation_key="pressure_tendency",
+        device_class=SensorDeviceClass.PRESSURE,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.trends.pressure_tendency,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="temperature_rate",
+        translation_key="temperature_rate",
+        icon="mdi:thermometer-lines",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.trends.temperature_rate,
+        unit_fn=lambda data: f"{_temperature_unit(data)}/h",
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="wind_gust_peak",
+        translation_key="wind_gust_peak",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
+        value_fn=lambda data: data.trends.wind_gust_peak,
+        sections=frozenset({"current"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="precipitation_start",
+        translation_key="precipitation_start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda data: _timestamp(data.outlook.precipitation_start),
+        sections=frozenset({"hourly"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="freezing_start",
+        translation_key="freezing_start",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda data: _timestamp(data.outlook.freezing_start),
+        sections=frozenset({"hourly"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="temperature_max_24h",
+        translation_key="temperature_max_24h",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        unit_fn=_temperature_unit,
+        value_fn=lambda data: data.outlook.temperature_max,
+        sections=frozenset({"hourly"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="temperature_min_24h",
+        translation_key="temperature_min_24h",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        unit_fn=_temperature_unit,
+        value_fn=lambda data: data.outlook.temperature_min,
+        sections=frozenset({"hourly"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="wind_gust_max_24h",
+        translation_key="wind_gust_max_24h",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
+        value_fn=lambda data: data.outlook.wind_gust_max,
+        sections=frozenset({"hourly"}),
+    ),
     ArednMeshWeatherSensorEntityDescription(
         key="aqi",
         translation_key="aqi",
         device_class=SensorDeviceClass.AQI,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: data.aqi,
+        sections=frozenset({"air"}),
     ),
     ArednMeshWeatherSensorEntityDescription(
         key="pm25",
@@ -47,13 +193,146 @@ SENSOR_TYPES: tuple[ArednMeshWeatherSensorEntityDescription, ...] = (
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: data.pm25,
+        sections=frozenset({"air"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="aqi_peak",
+        translation_key="aqi_peak",
+        device_class=SensorDeviceClass.AQI,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.aqi_peak and data.aqi_peak[0],
+        attr_fn=lambda data: {"time": data.aqi_peak and data.aqi_peak[1]},
+        sections=frozenset({"air"}),
+    ),
+    ArednMeshWeatherSensorEntityDescription(
+        key="pm25_peak",
+        translation_key="pm25_peak",
+        device_class=SensorDeviceClass.PM25,
+        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.pm25_peak and data.pm25_peak[0],
+        attr_fn=lambda data: {"time": data.pm25_peak and data.pm25_peak[1]},
+        sections=frozenset({"air"}),
     ),
     ArednMeshWeatherSensorEntityDescription(
         key="alerts",
         translation_key="nws_alerts",
         icon="mdi:alert",
-        value_fn=lambda data: len(data.alerts),
-        attr_fn=lambda data: {"alerts": [alert["properties"] for alert in data.alerts]},
+        value_fn=lambda data: len(data.alert_index.active()),
+        attr_fn=lambda data: {
+            "alerts": data.alert_index.summary(),
+            "details": data.alert_index.details(),
+        },
+        sections=frozenset({"alerts"}),
+    ),
+)
+
+DIAGNOSTIC_SENSOR_TYPES: tuple[
+    ArednMeshWeatherDiagnosticSensorEntityDescription, ...
+] = (
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="last_bytes_received",
+        translation_key="last_bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.node.last_bytes_received,
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="last_bytes_decoded",
+        translation_key="last_bytes_decoded",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.node.last_bytes_decoded,
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="total_bytes_received",
+        translation_key="total_bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.node.total_bytes_received,
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="last_live_update",
+        translation_key="last_live_update",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.last_live_update,
+        attr_fn=lambda coordinator: {"stale": coordinator.is_stale},
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="connection",
+        translation_key="connection",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in BreakerState],
+        value_fn=lambda coordinator: coordinator.node.breaker.state,
+        attr_fn=lambda coordinator: {
+            "consecutive_failures": coordinator.node.breaker.failures,
+            "retry_at": (
+                dt_util.utc_from_timestamp(coordinator.node.breaker.retry_at)
+                if coordinator.node.breaker.retry_at
+                else None
+            ),
+            "latency_p90": coordinator.node.latency.p90,
+            "timeout": coordinator.node.latency.timeout,
+        },
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="connection_reuse",
+        translation_key="connection_reuse",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.node.connection_stats.reuse_rate,
+        attr_fn=lambda coordinator: {
+            "connections_created": coordinator.node.connection_stats.created,
+            "connections_reused": coordinator.node.connection_stats.reused,
+            "dns_cache_hits": coordinator.node.connection_stats.dns_hits,
+            "dns_cache_misses": coordinator.node.connection_stats.dns_misses,
+            "pool_reuse_rate": coordinator.node.pool.stats.reuse_rate,
+        },
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="data_source",
+        translation_key="data_source",
+        value_fn=lambda coordinator: coordinator.mirrors.source.url,
+        attr_fn=lambda coordinator: coordinator.mirrors.stats(),
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="suppression_rate",
+        translation_key="suppression_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.suppression_rate,
+        attr_fn=lambda coordinator: {
+            "updates_sent": coordinator.listener_updates_sent,
+            "updates_suppressed": coordinator.listener_updates_suppressed,
+        },
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="parse_loop_time",
+        translation_key="parse_loop_time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            None
+            if coordinator.node.last_loop_time is None
+            else coordinator.node.last_loop_time * 1000
+        ),
+        attr_fn=lambda coordinator: {
+            "offloaded": coordinator.node.last_parse_offloaded,
+            "threshold": coordinator.node.parse_threshold,
+        },
+    ),
+    ArednMeshWeatherDiagnosticSensorEntityDescription(
+        key="data_age",
+        translation_key="data_age",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.data_age,
     ),
 )
 
@@ -66,8 +345,16 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator: ArednMeshWeatherCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        ArednMeshWeatherSensor(coordinator, entry, description)
-        for description in SENSOR_TYPES
+        [
+            *(
+                ArednMeshWeatherSensor(coordinator, entry, description)
+                for description in SENSOR_TYPES
+            ),
+            *(
+                ArednMeshWeatherDiagnosticSensor(coordinator, entry, description)
+                for description in DIAGNOSTIC_SENSOR_TYPES
+            ),
+        ]
     )
 
 
@@ -78,6 +365,8 @@ class ArednMeshWeatherSensor(
 
     entity_description: ArednMeshWeatherSensorEntityDescription
     _attr_has_entity_name = True
+    # The full alert text can run to tens of KB; keep it out of the recorder
+    _unrecorded_attributes = frozenset({"details"})
 
     def __init__(
         self,
@@ -86,7 +375,7 @@ class ArednMeshWeatherSensor(
         description: ArednMeshWeatherSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.sections)
         self.entity_description = description
         self._attr_unique_id = f"{entry.unique_id}-{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -94,13 +383,64 @@ class ArednMeshWeatherSensor(
         )
 
     @property
-    def native_value(self) -> int | float | str | None:
+    def native_value(self) -> int | float | str | datetime | None:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator.data)
 
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit, which may follow the node's units."""
+        if self.entity_description.unit_fn:
+            return self.entity_description.unit_fn(self.coordinator.data)
+        return super().native_unit_of_measurement
+
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes."""
         if self.entity_description.attr_fn:
             return self.entity_description.attr_fn(self.coordinator.data)
         return None
+
+
+class ArednMeshWeatherDiagnosticSensor(ArednMeshWeatherSensor):
+    """
+    AREDN Mesh Weather diagnostic sensor entity.
+
+    Reports on the coordinator itself rather than the weather data, and is
+    updated after every poll even when the data has not changed.
+    """
+
+    entity_description: ArednMeshWeatherDiagnosticSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the node is failing, which is when it matters."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to poll statistics updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> int | float | str | datetime | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit from the description."""
+        return self.entity_description.native_unit_of_measurement
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        if self.entity_description.attr_fn:
+            return self.entity_description.attr_fn(self.coordinator)
+        return None
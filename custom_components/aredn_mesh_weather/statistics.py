@@ -0,0 +1,115 @@
+"""Import of node observations into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfPressure, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigEntry
+
+    from .history import ObservationHistory
+    from .parser import ArednMeshWeatherData
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArednMeshWeatherStatisticDescription:
+    """Describes an observation imported as an external statistic."""
+
+    key: str
+    name: str
+    unit_fn: Callable[[ArednMeshWeatherData], str | None]
+
+
+STATISTIC_TYPES: tuple[ArednMeshWeatherStatisticDescription, ...] = (
+    ArednMeshWeatherStatisticDescription(
+        key="temperature",
+        name="Temperature",
+        unit_fn=lambda data: (
+            UnitOfTemperature.FAHRENHEIT
+            if data.temperature_unit == "°F"
+            else UnitOfTemperature.CELSIUS
+        ),
+    ),
+    ArednMeshWeatherStatisticDescription(
+        key="pressure",
+        name="Pressure",
+        unit_fn=lambda _: UnitOfPressure.HPA,
+    ),
+    ArednMeshWeatherStatisticDescription(
+        key="aqi",
+        name="AQI",
+        unit_fn=lambda _: None,
+    ),
+)
+
+
+class ArednMeshWeatherStatisticsImporter:
+    """
+    Imports hourly statistics of a node's observations for one config entry.
+
+    Each import covers the complete hours not yet imported, with one row per
+    hour and statistic, handed to the recorder as a single job per statistic.
+    The first import after startup backfills every hour held in the history;
+    the recorder replaces rows for hours it already has. Nothing is imported
+    while the recorder is not loaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self._title = entry.title
+        self._prefix = f"{DOMAIN}:{slugify(entry.entry_id)}"
+        # Start of the first hour not yet imported, in seconds since the epoch
+        self._imported_until = 0.0
+
+    @callback
+    def async_import(
+        self, history: ObservationHistory, data: ArednMeshWeatherData
+    ) -> int:
+        """Import the hours completed since the last import; return the rows."""
+        if "recorder" not in self.hass.config.components:
+            return 0
+        rows = 0
+        since = self._imported_until
+        for description in STATISTIC_TYPES:
+            hourly = history.hourly(description.key, since)
+            if not hourly:
+                continue
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self._title} {description.name}",
+                source=DOMAIN,
+                statistic_id=f"{self._prefix}_{description.key}",
+                unit_of_measurement=description.unit_fn(data),
+            )
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [
+                    StatisticData(
+                        start=dt_util.utc_from_timestamp(start),
+                        mean=mean,
+                        min=low,
+                        max=high,
+                    )
+                    for start, mean, low, high in hourly
+                ],
+            )
+            rows += len(hourly)
+            self._imported_until = max(self._imported_until, hourly[-1][0] + 3600)
+        return rows
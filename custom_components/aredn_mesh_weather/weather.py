@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLOUDY,
     ATTR_CONDITION_FOG,
@@ -9,30 +11,70 @@ from homeassistant.components.weather import (
     ATTR_CONDITION_SNOWY,
     ATTR_CONDITION_SUNNY,
     ATTR_FORECAST_CONDITION,
+    ATTR_FORECAST_HUMIDITY,
+    ATTR_FORECAST_NATIVE_DEW_POINT,
     ATTR_FORECAST_NATIVE_TEMP,
     ATTR_FORECAST_NATIVE_TEMP_LOW,
+    ATTR_FORECAST_NATIVE_WIND_GUST_SPEED,
     ATTR_FORECAST_NATIVE_WIND_SPEED,
     ATTR_FORECAST_PRECIPITATION,
     ATTR_FORECAST_TIME,
     ATTR_FORECAST_WIND_BEARING,
     Forecast,
-    WeatherEntityFeature,
     WeatherEntity,
+    WeatherEntityFeature,
+    round_temperature,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import DOMAIN, WMO_TO_HA_CONDITION
 from .coordinator import ArednMeshWeatherCoordinator
 
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+# Forecast keys mapped to ForecastSeries fields, per forecast type
+FORECAST_KEYS: dict[str, dict[str, str]] = {
+    "daily": {
+        ATTR_FORECAST_TIME: "datetime",
+        ATTR_FORECAST_CONDITION: "condition",
+        ATTR_FORECAST_NATIVE_TEMP: "temperature",
+        ATTR_FORECAST_NATIVE_TEMP_LOW: "templow",
+        ATTR_FORECAST_PRECIPITATION: "precipitation",
+        ATTR_FORECAST_NATIVE_WIND_SPEED: "wind_speed",
+        ATTR_FORECAST_WIND_BEARING: "wind_bearing",
+    },
+    "hourly": {
+        ATTR_FORECAST_TIME: "datetime",
+        ATTR_FORECAST_CONDITION: "condition",
+        ATTR_FORECAST_NATIVE_TEMP: "temperature",
+        ATTR_FORECAST_PRECIPITATION: "precipitation",
+        ATTR_FORECAST_NATIVE_WIND_SPEED: "wind_speed",
+        ATTR_FORECAST_WIND_BEARING: "wind_bearing",
+        ATTR_FORECAST_NATIVE_WIND_GUST_SPEED: "wind_gust_speed",
+        ATTR_FORECAST_HUMIDITY: "humidity",
+        ATTR_FORECAST_NATIVE_DEW_POINT: "dew_point",
+        "heat_index": "heat_index",
+        "wind_chill": "wind_chill",
+        "humidex": "humidex",
+        "aqi": "aqi",
+        "pm25": "pm25",
+    },
+}
+FORECAST_CONVERT = {ATTR_FORECAST_CONDITION: WMO_TO_HA_CONDITION.get}
+# Forecast keys of our own holding temperatures. WeatherEntity only converts
+# its native_ keys, so these are converted to the entity's unit here.
+FORECAST_TEMPERATURE_KEYS = ("heat_index", "wind_chill")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -59,7 +101,7 @@ class ArednMeshWeatherEntity(
         self, coordinator: ArednMeshWeatherCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize the weather entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({"current", "daily", "hourly"}))
         self._attr_unique_id = entry.unique_id
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -67,6 +109,12 @@ class ArednMeshWeatherEntity(
             manufacturer="AREDN",
             model="Mesh Weather Node",
         )
+        # Section digests of the data last handled, and converted forecasts
+        # keyed by type along with the digest and temperature unit they were
+        # built for
+        self._digests: dict[str, int] = {}
+        self._available: bool | None = None
+        self._forecasts: dict[str, tuple[tuple[int | None, str], list[Forecast]]] = {}
 
     @property
     def apparent_temperature(self) -> float | None:
@@ -101,6 +149,11 @@ class ArednMeshWeatherEntity(
             return UnitOfTemperature.FAHRENHEIT
         return UnitOfTemperature.CELSIUS
 
+    @property
+    def native_dew_point(self) -> float | None:
+        """Return the dew point."""
+        return self.coordinator.data.dew_point
+
     @property
     def native_pressure(self) -> float | None:
         """Return the pressure."""
@@ -131,31 +184,67 @@ class ArednMeshWeatherEntity(
         """Return the wind bearing."""
         return self.coordinator.data.wind_bearing
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Handle updated data from the coordinator.
+
+        State is only written when current conditions or availability changed,
+        and forecast subscribers are only pushed the forecast types that changed.
+        """
+        digests = self.coordinator.data.digests
+        changed = {
+            section
+            for section in ("current", "daily", "hourly")
+            if digests.get(section) != self._digests.get(section)
+        }
+        self._digests = digests
+        if "current" in changed or self.available != self._available:
+            self._available = self.available
+            self.async_write_ha_state()
+        if forecast_types := sorted(changed & {"daily", "hourly"}):
+            self.coordinator.config_entry.async_create_background_task(
+                self.hass,
+                self.async_update_listeners(forecast_types),
+                "update weather forecast",
+            )
+
+    def _convert_temperature(self, value: float | None) -> float | None:
+        """Convert a forecast temperature to the unit the entity is shown in."""
+        if value is None:
+            return None
+        return round_temperature(
+            TemperatureConverter.convert(
+                value, self.native_temperature_unit, self._temperature_unit
+            ),
+            self.precision,
+        )
+
+    def _cached_forecast(self, forecast_type: str) -> list[Forecast]:
+        """Return a forecast, converting it only when its content or unit changed."""
+        data = self.coordinator.data
+        built_for = (data.digests.get(forecast_type), self._temperature_unit)
+        cached = self._forecasts.get(forecast_type)
+        if cached is None or cached[0] != built_for:
+            series = (
+                data.forecast_daily
+                if forecast_type == "daily"
+                else data.forecast_hourly
+            )
+            keys = FORECAST_KEYS[forecast_type]
+            convert = FORECAST_CONVERT | {
+                key: self._convert_temperature
+                for key in FORECAST_TEMPERATURE_KEYS
+                if key in keys
+            }
+            cached = (built_for, list(series.rows(keys, convert)))
+            self._forecasts[forecast_type] = cached
+        return cached[1]
+
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
-        return [
-            {
-                ATTR_FORECAST_TIME: f_item["datetime"],
-                ATTR_FORECAST_CONDITION: WMO_TO_HA_CONDITION.get(f_item["condition"]),
-                ATTR_FORECAST_NATIVE_TEMP: f_item["temperature"],
-                ATTR_FORECAST_NATIVE_TEMP_LOW: f_item["templow"],
-                ATTR_FORECAST_PRECIPITATION: f_item["precipitation"],
-                ATTR_FORECAST_NATIVE_WIND_SPEED: f_item["wind_speed"],
-                ATTR_FORECAST_WIND_BEARING: f_item["wind_bearing"],
-            }
-            for f_item in self.coordinator.data.forecast_daily
-        ]
+        return self._cached_forecast("daily")
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast."""
-        return [
-            {
-                ATTR_FORECAST_TIME: f_item["datetime"],
-                ATTR_FORECAST_CONDITION: WMO_TO_HA_CONDITION.get(f_item["condition"]),
-                ATTR_FORECAST_NATIVE_TEMP: f_item["temperature"],
-                ATTR_FORECAST_PRECIPITATION: f_item["precipitation"],
-                ATTR_FORECAST_NATIVE_WIND_SPEED: f_item["wind_speed"],
-                ATTR_FORECAST_WIND_BEARING: f_item["wind_bearing"],
-            }
-            for f_item in self.coordinator.data.forecast_hourly
-        ]
+        return self._cached_forecast("hourly")
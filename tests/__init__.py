@@ -0,0 +1 @@
+"""Tests for the AREDN Mesh Weather integration."""
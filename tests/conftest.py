@@ -0,0 +1,151 @@
+"""Fixtures for AREDN Mesh Weather tests."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.const import CONF_URL
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aredn_mesh_weather.const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.aredn_mesh_weather.coordinator import (
+        ArednMeshWeatherCoordinator,
+    )
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_payload() -> dict[str, Any]:
+    """Return a copy of the sample node payload."""
+    return json.loads((FIXTURES / "payload.json").read_text(encoding="utf-8"))
+
+
+async def setup_entry(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> ArednMeshWeatherCoordinator:
+    """Set up ``entry`` and return its coordinator."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+def expire(coordinator: ArednMeshWeatherCoordinator) -> None:
+    """Make the node's data too old to be reused by the next refresh."""
+    coordinator.node._fetched_at = None
+
+
+def entity_id(hass: HomeAssistant, entry: MockConfigEntry, key: str) -> str:
+    """Return the entity id of an entry's sensor by description key."""
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.unique_id}-{key}"
+    )
+
+
+class StandInNode:
+    """
+    A local web server standing in for a Mesh Weather node.
+
+    Serves ``payload`` at any path with an ETag derived from ``version``, and
+    answers conditional requests for the current version with 304. Tests
+    change the attributes to change its behaviour.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the node with the sample payload."""
+        self.payload = load_payload()
+        self.version = 1
+        self.status = 200
+        self.delay = 0.0
+        self.content_type = "application/json"
+        self.content_encoding: str | None = None
+        self.body: bytes | None = None
+        self.requests: list[web.Request] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.server: TestServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the node's data URL."""
+        return str(self.server.make_url("/?mode=data"))
+
+    @property
+    def etag(self) -> str:
+        """Return the ETag of the current version."""
+        return f'"v{self.version}"'
+
+    def publish(self, **current: Any) -> None:
+        """Publish a new version, with changes to the current observation."""
+        self.payload = copy.deepcopy(self.payload)
+        self.payload["weather"]["current"].update(current)
+        self.version += 1
+
+    async def async_start(self) -> None:
+        """Start serving on a local port."""
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handle)
+        self.server = TestServer(app, host="127.0.0.1")
+        await self.server.start_server()
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request for the node's data."""
+        self.requests.append(request)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.status != 200:
+                return web.Response(status=self.status)
+            if request.headers.get("If-None-Match") == self.etag:
+                return web.Response(status=304, headers={"ETag": self.etag})
+            body = self.body if self.body is not None else json.dumps(self.payload)
+            headers = {"ETag": self.etag, "Content-Type": self.content_type}
+            if self.content_encoding:
+                headers["Content-Encoding"] = self.content_encoding
+            return web.Response(
+                body=body.encode() if isinstance(body, str) else body, headers=headers
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the integration."""
+
+
+@pytest.fixture
+async def stand_in_node(socket_enabled: None) -> AsyncGenerator[StandInNode]:
+    """Run a stand-in node on a local port."""
+    node = StandInNode()
+    await node.async_start()
+    yield node
+    await node.server.close()
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant, stand_in_node: StandInNode) -> MockConfigEntry:
+    """Return a config entry for the stand-in node, added to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="KX6XXX-weather",
+        unique_id=stand_in_node.url,
+        data={CONF_URL: stand_in_node.url},
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,114 @@
+"""Tests for the node client."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.aredn_mesh_weather.api import (
+    ArednMeshWeatherNode,
+    async_get_node_registry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import StandInNode
+
+
+@pytest.fixture
+async def node(
+    hass: HomeAssistant, stand_in_node: StandInNode
+) -> AsyncGenerator[ArednMeshWeatherNode]:
+    """Return a node client for the stand-in node."""
+    registry = async_get_node_registry(hass)
+    yield await registry.async_acquire("entry", stand_in_node.url)
+    registry.release("entry")
+    await hass.async_block_till_done()
+
+
+async def test_conditional_get(
+    node: ArednMeshWeatherNode, stand_in_node: StandInNode
+) -> None:
+    """Validators are sent back, and a 304 reuses the parsed data."""
+    first = await node.async_fetch()
+    assert "If-None-Match" not in stand_in_node.requests[0].headers
+    assert node.last_bytes_received > 0
+
+    second = await node.async_fetch()
+    assert stand_in_node.requests[1].headers["If-None-Match"] == stand_in_node.etag
+    assert second is first
+    assert node.last_bytes_received == 0
+
+    stand_in_node.publish(temperature_2m=70.0)
+    third = await node.async_fetch()
+    assert third is not first
+    assert third.temperature == 70.0
+
+
+async def test_concurrent_fetches_share_a_request(
+    node: ArednMeshWeatherNode, stand_in_node: StandInNode
+) -> None:
+    """Callers fetching at once share one request, and recent data is reused."""
+    stand_in_node.delay = 0.05
+    results = await asyncio.gather(*(node.async_fetch() for _ in range(3)))
+    assert results[0] is results[1] is results[2]
+    assert len(stand_in_node.requests) == 1
+
+    assert await node.async_fetch(max_age=60) is results[0]
+    assert len(stand_in_node.requests) == 1
+
+
+async def test_offload_goes_by_last_payload_parsed(
+    node: ArednMeshWeatherNode, stand_in_node: StandInNode
+) -> None:
+    """A small compressed body of a large payload is parsed in the executor."""
+    await node.async_fetch()
+    assert not node.last_parse_offloaded
+    node.parse_threshold = node.last_bytes_decoded
+
+    # A 304 between polls does not make the node forget the payload size
+    await node.async_fetch()
+    assert node.last_bytes_decoded == 0
+
+    stand_in_node.publish(temperature_2m=70.0)
+    stand_in_node.body = gzip.compress(json.dumps(stand_in_node.payload).encode())
+    stand_in_node.content_encoding = "gzip"
+    data = await node.async_fetch()
+    assert node.last_bytes_received < node.parse_threshold
+    assert node.last_parse_offloaded
+    assert data.temperature == 70.0
+
+
+async def test_history_is_kept_in_utc(
+    hass: HomeAssistant, node: ArednMeshWeatherNode
+) -> None:
+    """Node times are read in Home Assistant's time zone, not the process's."""
+    await hass.config.async_set_time_zone("US/Pacific")
+    await node.async_fetch()
+    # The sample's 13:15 is Pacific daylight time
+    assert node.history.as_dict()["time"][-1] == (
+        datetime(2026, 10, 17, 20, 15, tzinfo=UTC).timestamp()
+    )
+
+
+async def test_loop_time_counts_sections_parsed_later(
+    node: ArednMeshWeatherNode,
+) -> None:
+    """Sections parsed inline after the fetch add to the time on the loop."""
+    data = await node.async_fetch()
+    assert not node.last_parse_offloaded
+    loop_time, parse_time = node.last_loop_time, data.parse_time
+
+    data.materialize()
+    assert data.parse_time > parse_time
+    assert node.last_loop_time == pytest.approx(
+        loop_time + data.parse_time - parse_time
+    )
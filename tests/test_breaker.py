@@ -0,0 +1,82 @@
+"""Tests for the circuit breaker and adaptive timeouts."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.aredn_mesh_weather.breaker import (
+    BreakerState,
+    CircuitBreaker,
+    LatencyTracker,
+)
+
+
+def test_breaker_opens_probes_and_closes() -> None:
+    """Consecutive failures open the breaker until a trial request succeeds."""
+    breaker = CircuitBreaker(threshold=3, base=60)
+    for _ in range(2):
+        breaker.record_failure(1000)
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow_request(1000)
+
+    breaker.record_failure(1000)
+    assert breaker.state is BreakerState.OPEN
+    assert 1030 <= breaker.retry_at <= 1060
+    assert not breaker.allow_request(breaker.retry_at - 1)
+
+    # Once the backoff has passed, one trial request goes through
+    assert breaker.allow_request(breaker.retry_at)
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.retry_at is None
+
+
+def test_breaker_backoff_doubles_up_to_cap() -> None:
+    """Each failed trial doubles the backoff, up to the cap, until one succeeds."""
+    breaker = CircuitBreaker(threshold=1, base=60, cap=300)
+    backoffs = []
+    now = 0.0
+    with patch("custom_components.aredn_mesh_weather.breaker.random.uniform") as jitter:
+        jitter.return_value = 1
+        for _ in range(5):
+            breaker.record_failure(now)
+            backoffs.append(breaker.retry_at - now)
+            now = breaker.retry_at
+            assert breaker.allow_request(now)
+    assert backoffs == [60, 120, 240, 300, 300]
+
+    breaker.record_success()
+    breaker.record_failure(now)
+    assert breaker.retry_at - now <= 60
+
+
+@pytest.mark.parametrize(
+    ("latency", "timeout"),
+    [(0.1, 3), (2.0, 8.0), (10.0, 30)],
+)
+def test_timeout_is_clamped(latency: float, timeout: float) -> None:
+    """The timeout is four times the 90th percentile, within 3 to 30 seconds."""
+    tracker = LatencyTracker()
+    for _ in range(tracker.min_samples - 1):
+        tracker.record(latency)
+    assert tracker.timeout == tracker.default
+
+    tracker.record(latency)
+    assert tracker.timeout == timeout
+
+
+def test_timeout_follows_the_90th_percentile() -> None:
+    """One slow request in twenty does not set the timeout, two do."""
+    tracker = LatencyTracker()
+    for _ in range(19):
+        tracker.record(1.0)
+    tracker.record(7.0)
+    assert tracker.timeout == 4.0
+
+    tracker.record(7.0)
+    assert tracker.timeout == 28.0
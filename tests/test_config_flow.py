@@ -0,0 +1,108 @@
+"""Tests for the AREDN Mesh Weather config flow."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.const import CONF_URL
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.aredn_mesh_weather.const import (
+    CONF_MIRRORS,
+    CONF_PARSE_THRESHOLD,
+    DOMAIN,
+)
+
+from .conftest import setup_entry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .conftest import StandInNode
+
+
+async def manual_step(hass: HomeAssistant, url: str) -> dict:
+    """Enter ``url`` in the manual step of a new flow and return the result."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_URL: url}
+    )
+
+
+async def test_manual_setup(hass: HomeAssistant, stand_in_node: StandInNode) -> None:
+    """A node entered by URL is set up under its own name."""
+    result = await manual_step(hass, stand_in_node.url)
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == stand_in_node.payload["geo"]["node"]
+    assert result["data"] == {CONF_URL: stand_in_node.url}
+
+
+async def test_manual_rejects_other_content(
+    hass: HomeAssistant, stand_in_node: StandInNode
+) -> None:
+    """A page of another content type is rejected without being read."""
+    stand_in_node.content_type = "text/html"
+    result = await manual_step(hass, stand_in_node.url)
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_data"}
+
+
+async def test_options_set_the_parse_threshold(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """The threshold is given in KiB and applies to the entry's node."""
+    await setup_entry(hass, config_entry)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_PARSE_THRESHOLD: 16}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {CONF_MIRRORS: [], CONF_PARSE_THRESHOLD: 16}
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert coordinator.node.parse_threshold == 16 * 1024
+
+
+async def test_options_check_new_mirrors(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Mirrors are probed when added, like a node entered by URL."""
+    await setup_entry(hass, config_entry)
+    mirror = str(stand_in_node.server.make_url("/mirror?mode=data"))
+    user_input = {CONF_MIRRORS: [mirror], CONF_PARSE_THRESHOLD: 128}
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    stand_in_node.status = 500
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_MIRRORS: "cannot_connect"}
+    assert result["description_placeholders"] == {"mirror": mirror}
+
+    stand_in_node.status = 200
+    stand_in_node.content_type = "text/html"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+    assert result["errors"] == {CONF_MIRRORS: "invalid_data"}
+
+    stand_in_node.content_type = "application/json"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert config_entry.options[CONF_MIRRORS] == [mirror]
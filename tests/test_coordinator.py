@@ -0,0 +1,182 @@
+"""Tests for the AREDN Mesh Weather coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.const import CONF_URL, STATE_UNAVAILABLE
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.aredn_mesh_weather import connection
+from custom_components.aredn_mesh_weather.api import async_get_node_registry
+from custom_components.aredn_mesh_weather.const import (
+    DOMAIN,
+    EVENT_ALERT_ADDED,
+    MAX_CONCURRENT_FETCHES,
+    POLL_SPREAD,
+)
+
+from .conftest import entity_id, expire, setup_entry
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.aredn_mesh_weather.coordinator import (
+        ArednMeshWeatherCoordinator,
+    )
+
+    from .conftest import StandInNode
+
+
+async def test_failure_after_unchanged_refresh(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """A failed refresh makes every entity unavailable, even after a 304."""
+    coordinator = await setup_entry(hass, config_entry)
+    aqi = entity_id(hass, config_entry, "aqi")
+
+    expire(coordinator)
+    await coordinator.async_refresh()
+    assert stand_in_node.requests[-1].headers["If-None-Match"] == stand_in_node.etag
+    assert hass.states.get(aqi).state != STATE_UNAVAILABLE
+
+    stand_in_node.status = 500
+    expire(coordinator)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert hass.states.get(aqi).state == STATE_UNAVAILABLE
+
+    stand_in_node.status = 200
+    expire(coordinator)
+    await coordinator.async_refresh()
+    assert hass.states.get(aqi).state != STATE_UNAVAILABLE
+
+
+def age(coordinator: ArednMeshWeatherCoordinator, entry: float, node: float) -> None:
+    """Pretend this entry last fetched ``entry`` s ago and the node ``node`` s ago."""
+    coordinator._data_fetched_at -= entry
+    coordinator.node._fetched_at -= node
+
+
+async def test_recheck_does_not_reuse_own_data(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Data this entry already has is never taken as a fresh result."""
+    coordinator = await setup_entry(hass, config_entry)
+    requests = len(stand_in_node.requests)
+
+    # A late node is checked again after the minimum interval
+    coordinator.update_interval = timedelta(seconds=60)
+    age(coordinator, 61, 61)
+    await coordinator.async_refresh()
+    assert len(stand_in_node.requests) == requests + 1
+
+    # However long the scheduled delay
+    coordinator.update_interval = timedelta(seconds=900)
+    age(coordinator, 61, 61)
+    await coordinator.async_refresh()
+    assert len(stand_in_node.requests) == requests + 2
+
+
+async def test_reuses_data_fetched_by_another_entry(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Data another entry fetched since this one's last poll is reused."""
+    coordinator = await setup_entry(hass, config_entry)
+    requests = len(stand_in_node.requests)
+
+    coordinator.update_interval = timedelta(seconds=900)
+    age(coordinator, 300, 100)
+    await coordinator.async_refresh()
+    assert len(stand_in_node.requests) == requests
+    fetched = dt_util.utcnow() - coordinator.last_live_update
+    assert 99 < fetched.total_seconds() < 102
+
+
+async def test_alerts_not_announced_again_after_reload(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Alerts announced before a reload are not announced again after it."""
+    expires = (dt_util.utcnow() + timedelta(days=1)).isoformat()
+    for feature in stand_in_node.payload["nws_alerts"]["features"]:
+        feature["properties"]["expires"] = expires
+    added = async_capture_events(hass, EVENT_ALERT_ADDED)
+    await setup_entry(hass, config_entry)
+    assert len(added) == 2
+
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert len(added) == 2
+
+
+async def test_polls_are_spread_and_capped(
+    hass: HomeAssistant, stand_in_node: StandInNode, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Many entries polling at once keep to the domain-wide request limit."""
+    # The nodes all live on the stand-in's host; lift the per-host connection
+    # limit as if they were on hosts of their own
+    monkeypatch.setattr(connection, "CONNECTION_LIMIT_PER_HOST", 0)
+    stand_in_node.delay = 0.05
+    entries = []
+    for i in range(3 * MAX_CONCURRENT_FETCHES):
+        url = stand_in_node.url.replace("/?", f"/node{i}/?")
+        entry = MockConfigEntry(
+            domain=DOMAIN, title=f"node{i}", unique_id=url, data={CONF_URL: url}
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    # Every entry's first poll is due at startup
+    assert all(
+        await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+        )
+    )
+    await hass.async_block_till_done()
+    assert len(stand_in_node.requests) == len(entries)
+    assert stand_in_node.peak_in_flight == MAX_CONCURRENT_FETCHES
+
+    # The nodes share a refresh clock, so later polls differ by phase offset only
+    coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+    delays = sorted(c.update_interval.total_seconds() for c in coordinators)
+    assert len(set(delays)) == len(entries)
+    assert delays[-1] - delays[0] <= POLL_SPREAD.total_seconds()
+
+    stand_in_node.peak_in_flight = 0
+    for coordinator in coordinators:
+        expire(coordinator)
+    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    assert stand_in_node.peak_in_flight == MAX_CONCURRENT_FETCHES
+
+    # Without the shared limit the same refreshes overlap further
+    stand_in_node.peak_in_flight = 0
+    for coordinator in coordinators:
+        coordinator.node._fetch_slots = asyncio.Semaphore(len(entries))
+        expire(coordinator)
+    await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    assert stand_in_node.peak_in_flight > MAX_CONCURRENT_FETCHES
+
+
+async def test_setup_attaches_once(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Setup acquires the node once, with or without a snapshot to restore."""
+    registry = async_get_node_registry(hass)
+    with patch.object(
+        registry, "async_acquire", wraps=registry.async_acquire
+    ) as acquire:
+        coordinator = await setup_entry(hass, config_entry)
+        assert acquire.call_count == 1
+
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert acquire.call_count == 2
+    assert hass.data[DOMAIN][config_entry.entry_id] is not coordinator
@@ -0,0 +1,32 @@
+"""Tests for metrics derived from temperature, humidity and wind speed."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from custom_components.aredn_mesh_weather import derived
+
+from .conftest import load_payload
+
+
+@pytest.mark.parametrize("fahrenheit", [True, False])
+def test_numpy_matches_python(*, fahrenheit: bool) -> None:
+    """The vectorized and plain Python paths agree on the sample forecast."""
+    pytest.importorskip("numpy")
+    hourly = load_payload()["weather"]["hourly"]
+    columns = [
+        array("d", hourly[key])
+        for key in ("temperature_2m", "relative_humidity_2m", "wind_speed_10m")
+    ]
+    # The sample covers the heat index and wind chill ranges
+    assert min(columns[0]) < 50
+    assert max(columns[0]) > 80
+
+    vectorized = derived._derive_numpy(*columns, fahrenheit=fahrenheit)
+    plain = derived._derive_python(*columns, fahrenheit=fahrenheit)
+    for name in ("heat_index", "wind_chill", "dew_point"):
+        assert list(vectorized[name]) == pytest.approx(
+            list(plain[name]), abs=0.05, nan_ok=True
+        )
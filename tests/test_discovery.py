@@ -0,0 +1,153 @@
+"""Tests for discovering Mesh Weather nodes on the mesh."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.aredn_mesh_weather.const import DOMAIN
+from custom_components.aredn_mesh_weather.discovery import (
+    DiscoveredNode,
+    async_discover_nodes,
+    candidate_urls,
+)
+
+from .conftest import StandInNode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from homeassistant.core import HomeAssistant
+
+
+@dataclass
+class FakeMesh:
+    """Stand-in servers for the local node and the nodes it knows of."""
+
+    local: StandInNode
+    weather: list[StandInNode]
+    other: StandInNode
+
+    @property
+    def url(self) -> str:
+        """Return the local node's URL."""
+        return str(self.local.server.make_url("")).rstrip("/")
+
+
+@pytest.fixture
+async def fake_mesh(socket_enabled: None) -> AsyncGenerator[FakeMesh]:
+    """Run a local node listing two weather nodes and a web page among its services."""
+    weather = [StandInNode(), StandInNode()]
+    weather[1].payload["geo"]["node"] = "KY7YYY-weather"
+    other = StandInNode()
+    other.content_type = "text/html"
+    other.body = "<html><body>Weather station</body></html>"
+    local = StandInNode()
+    mesh = FakeMesh(local, weather, other)
+    for node in (local, *weather, other):
+        await node.async_start()
+
+    local.body = json.dumps(
+        {
+            "node": "KX6XXX-hap",
+            "services": [
+                {"name": "Mesh Weather", "link": weather[0].url},
+                {"name": "Backup weather", "link": weather[1].url},
+                {"name": "Weather page", "link": str(other.server.make_url("/"))},
+                {"name": "Camera", "link": "http://kx6xxx-cam.local.mesh/"},
+            ],
+            "hosts": [{"name": "KX6XXX-cam", "ip": "10.1.2.3"}],
+        }
+    )
+    yield mesh
+    for node in (local, *weather, other):
+        await node.server.close()
+
+
+def test_candidate_urls() -> None:
+    """Weather services and hosts are probed at the root of their host."""
+    sysinfo = {
+        "services": [
+            {"name": "Weather", "link": "http://kx6xxx-wx.local.mesh:8080/dash"},
+            {"name": "Chat", "link": "http://kx6xxx-chat.local.mesh/"},
+            {"name": "Node", "link": "http://kx6xxx-weather.local.mesh/status"},
+        ],
+        "hosts": [{"name": "KX6XXX-weather"}, {"name": "KX6XXX-cam"}, {}],
+    }
+    assert candidate_urls(sysinfo) == [
+        "http://kx6xxx-wx.local.mesh:8080/?mode=data",
+        "http://kx6xxx-weather.local.mesh/?mode=data",
+    ]
+    assert candidate_urls({}) == []
+
+
+async def test_discover_nodes(hass: HomeAssistant, fake_mesh: FakeMesh) -> None:
+    """Only nodes answering with Mesh Weather data are found, and results cached."""
+    session = async_get_clientsession(hass)
+    nodes = await async_discover_nodes(hass, session, fake_mesh.url)
+    assert sorted(nodes, key=lambda node: node.name) == [
+        DiscoveredNode(fake_mesh.weather[0].url, "KX6XXX-weather"),
+        DiscoveredNode(fake_mesh.weather[1].url, "KY7YYY-weather"),
+    ]
+    assert len(fake_mesh.other.requests) == 1
+
+    assert await async_discover_nodes(hass, session, fake_mesh.url) == nodes
+    assert len(fake_mesh.local.requests) == 1
+
+
+async def test_discover_skips_incomplete_data(
+    hass: HomeAssistant, fake_mesh: FakeMesh
+) -> None:
+    """A node whose data would not parse is not offered."""
+    del fake_mesh.weather[1].payload["weather"]["current"]
+    session = async_get_clientsession(hass)
+    nodes = await async_discover_nodes(hass, session, fake_mesh.url)
+    assert nodes == [DiscoveredNode(fake_mesh.weather[0].url, "KX6XXX-weather")]
+
+
+async def test_discover_without_local_node(
+    hass: HomeAssistant, fake_mesh: FakeMesh
+) -> None:
+    """Nothing is found when the local node does not answer."""
+    fake_mesh.local.status = 404
+    session = async_get_clientsession(hass)
+    assert await async_discover_nodes(hass, session, fake_mesh.url) == []
+
+
+async def test_scan_sets_up_selected_nodes(
+    hass: HomeAssistant, fake_mesh: FakeMesh
+) -> None:
+    """Each node picked from the scan gets an entry of its own."""
+
+    async def discover(hass: HomeAssistant, session: object) -> list[DiscoveredNode]:
+        return await async_discover_nodes(hass, session, fake_mesh.url)
+
+    with patch(
+        "custom_components.aredn_mesh_weather.config_flow.async_discover_nodes",
+        discover,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"next_step_id": "scan"}
+        )
+        assert result["type"] is FlowResultType.FORM
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"nodes": [node.url for node in fake_mesh.weather]}
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert sorted(entry.title for entry in entries) == [
+        "KX6XXX-weather",
+        "KY7YYY-weather",
+    ]
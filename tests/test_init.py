@@ -0,0 +1,90 @@
+"""Tests for setting up AREDN Mesh Weather entries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_URL, PERCENTAGE, UnitOfInformation
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aredn_mesh_weather.api import async_get_node_registry
+from custom_components.aredn_mesh_weather.const import DOMAIN
+
+from .conftest import entity_id, expire, setup_entry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import StandInNode
+
+
+async def test_setup_and_unload(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """An entry sets up every platform from the node and unloads cleanly."""
+    await setup_entry(hass, config_entry)
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert len(stand_in_node.requests) == 1
+    assert hass.states.async_entity_ids("weather")
+
+    state = hass.states.get(entity_id(hass, config_entry, "aqi"))
+    assert state.state not in ("unavailable", "unknown")
+    state = hass.states.get(entity_id(hass, config_entry, "last_bytes_received"))
+    assert int(state.state) > 0
+    assert state.attributes["unit_of_measurement"] == UnitOfInformation.BYTES
+    state = hass.states.get(entity_id(hass, config_entry, "connection_reuse"))
+    assert state.attributes["unit_of_measurement"] == PERCENTAGE
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_setup_without_recorder(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Entries work without the recorder, and import no statistics."""
+    with patch(
+        "custom_components.aredn_mesh_weather.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        coordinator = await setup_entry(hass, config_entry)
+        # Complete an hour of history
+        stand_in_node.publish(time="2026-10-17T14:15")
+        expire(coordinator)
+        await coordinator.async_refresh()
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert "recorder" not in hass.config.components
+    add_statistics.assert_not_called()
+
+
+async def test_unload_one_of_two_entries_on_a_node(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Unloading an entry shuts it down once and leaves the shared node to the other."""
+    # The same node by another spelling of its URL
+    alias = stand_in_node.url.replace("/?", "?")
+    other = MockConfigEntry(
+        domain=DOMAIN, title="alias", unique_id=alias, data={CONF_URL: alias}
+    )
+    other.add_to_hass(hass)
+    # Setting up the integration sets up both
+    await setup_entry(hass, config_entry)
+    registry = async_get_node_registry(hass)
+    coordinator = hass.data[DOMAIN][other.entry_id]
+    assert hass.data[DOMAIN][config_entry.entry_id].node is coordinator.node
+
+    with patch.object(registry, "release", wraps=registry.release) as release:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+    release.assert_called_once_with(config_entry.entry_id)
+
+    assert registry.pool is not None
+    assert not registry.pool.session.closed
+    stand_in_node.publish(temperature_2m=70.0)
+    expire(coordinator)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data.temperature == 70.0
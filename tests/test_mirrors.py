@@ -0,0 +1,126 @@
+"""Tests for fetching from mirrored nodes."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.aredn_mesh_weather.api import async_get_node_registry
+from custom_components.aredn_mesh_weather.const import MIRROR_PROBE_EVERY
+from custom_components.aredn_mesh_weather.mirrors import ArednMeshWeatherMirrors
+
+from .conftest import StandInNode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture
+async def mirror_node(socket_enabled: None) -> AsyncGenerator[StandInNode]:
+    """Run a second stand-in node publishing the same data."""
+    node = StandInNode()
+    await node.async_start()
+    yield node
+    await node.server.close()
+
+
+@pytest.fixture
+async def mirrors(
+    hass: HomeAssistant, stand_in_node: StandInNode, mirror_node: StandInNode
+) -> AsyncGenerator[ArednMeshWeatherMirrors]:
+    """Return mirrors of the stand-in node, in that order."""
+    registry = async_get_node_registry(hass)
+    nodes = [
+        await registry.async_acquire("entry", stand_in_node.url),
+        await registry.async_acquire("entry", mirror_node.url),
+    ]
+    yield ArednMeshWeatherMirrors(hass, nodes)
+    await hass.async_block_till_done()
+    registry.release("entry")
+    await hass.async_block_till_done()
+
+
+def test_ranking(mirrors: ArednMeshWeatherMirrors) -> None:
+    """Mirrors rank by latency over success rate, backing off ones last."""
+    first, second = mirrors.nodes
+    first.latency.samples.extend([0.5] * 5)
+    second.latency.samples.extend([0.1] * 5)
+    assert mirrors.ranked() == [second, first]
+
+    # A failing mirror costs more than a slow one
+    for _ in range(10):
+        mirrors.scores[second.url].record(ok=False)
+    assert mirrors.cost(second) > mirrors.cost(first)
+    assert mirrors.ranked() == [first, second]
+
+    # One whose breaker is open goes last however cheap
+    mirrors.scores[second.url].success = 1.0
+    for _ in range(first.breaker.threshold):
+        first.breaker.record_failure(time.time())
+    mirrors.source = second
+    first.latency.samples.extend([0.01] * 20)
+    assert mirrors.ranked() == [second, first]
+
+
+def test_switch_margin(mirrors: ArednMeshWeatherMirrors) -> None:
+    """The source keeps its place unless another mirror is clearly better."""
+    first, second = mirrors.nodes
+    first.latency.samples.extend([0.5] * 5)
+    second.latency.samples.extend([0.45] * 5)
+    assert mirrors.source is first
+    assert mirrors.ranked() == [first, second]
+
+    second.latency.samples.extend([0.35] * 10)
+    assert mirrors.ranked() == [second, first]
+
+
+async def test_slow_source_is_raced(
+    mirrors: ArednMeshWeatherMirrors,
+    stand_in_node: StandInNode,
+    mirror_node: StandInNode,
+) -> None:
+    """A mirror is raced against a slow source, and the first answer wins."""
+    first, second = mirrors.nodes
+    first.latency.samples.extend([0.01] * 5)
+    stand_in_node.delay = 0.5
+    with patch(
+        "custom_components.aredn_mesh_weather.mirrors.MIRROR_HEDGE_MIN_DELAY", 0.05
+    ):
+        await mirrors.async_fetch()
+
+    assert mirrors.races == 1
+    assert mirrors.fallbacks == 1
+    assert mirrors.source is second
+    assert len(mirror_node.requests) == 1
+
+
+async def test_failure_starts_next_mirror(
+    mirrors: ArednMeshWeatherMirrors, stand_in_node: StandInNode
+) -> None:
+    """A failing source is replaced at once, without waiting to race."""
+    stand_in_node.status = 500
+    await mirrors.async_fetch()
+
+    assert mirrors.races == 0
+    assert mirrors.fallbacks == 1
+    assert mirrors.source is mirrors.nodes[1]
+    assert mirrors.scores[stand_in_node.url].success < 1
+
+
+async def test_first_probe_waits(
+    hass: HomeAssistant, mirrors: ArednMeshWeatherMirrors, mirror_node: StandInNode
+) -> None:
+    """Idle mirrors are first probed once MIRROR_PROBE_EVERY fetches are done."""
+    for _ in range(MIRROR_PROBE_EVERY):
+        await mirrors.async_fetch()
+        await hass.async_block_till_done()
+    assert not mirror_node.requests
+
+    await mirrors.async_fetch()
+    await hass.async_block_till_done()
+    assert len(mirror_node.requests) == 1
@@ -0,0 +1,144 @@
+"""Tests for parsing AREDN Mesh Weather payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from custom_components.aredn_mesh_weather.api import parse_body
+from custom_components.aredn_mesh_weather.parser import (
+    AIR_FIELDS,
+    ArednMeshWeatherData,
+    ForecastSeries,
+    InvalidData,
+    time_index,
+)
+
+from .conftest import load_payload
+
+
+def test_parse_sample() -> None:
+    """The sample payload parses, forecasts included."""
+    data = ArednMeshWeatherData.from_dict(load_payload())
+    data.materialize()
+    assert len(data.forecast_hourly) > 0
+    assert data.aqi is not None
+
+
+@pytest.mark.parametrize(
+    ("section", "key", "value"),
+    [
+        ("hourly", "relative_humidity_2m", lambda values: values[:-1]),
+        ("hourly", "wind_gusts_10m", lambda values: values[:-1]),
+        ("hourly", "temperature_2m", lambda values: values[:-1]),
+        ("hourly", "relative_humidity_2m", lambda values: ["n/a"] * len(values)),
+        ("hourly", "wind_gusts_10m", lambda values: [*values[:-1], True]),
+        ("daily", "temperature_2m_max", lambda values: [*values[:-1], "n/a"]),
+        ("daily", "time", lambda values: [1, *values[1:]]),
+    ],
+)
+def test_malformed_columns(section: str, key: str, value: Any) -> None:
+    """Short or non-numeric forecast columns are rejected when parsed."""
+    payload = load_payload()
+    columns = payload["weather"][section]
+    columns[key] = value(columns[key])
+    data = ArednMeshWeatherData.from_dict(payload)
+    with pytest.raises(InvalidData):
+        getattr(data, f"forecast_{section}")
+
+
+@pytest.mark.parametrize("index", [0, -1])
+def test_malformed_air_quality(index: int) -> None:
+    """Non-numeric air quality is rejected when parsed."""
+    payload = load_payload()
+    payload["air"]["hourly"]["us_aqi"][index] = "n/a"
+    data = ArednMeshWeatherData.from_dict(payload)
+    with pytest.raises(InvalidData):
+        data.materialize()
+
+
+def test_digests_follow_the_current_hour() -> None:
+    """Only sections whose shown content changed are reported as changed."""
+    payload = load_payload()
+    first = ArednMeshWeatherData.from_dict(payload)
+    assert first.changed_sections(ArednMeshWeatherData.from_dict(payload)) == set()
+
+    payload["weather"]["daily"]["temperature_2m_max"][-1] += 1
+    assert first.changed_sections(ArednMeshWeatherData.from_dict(payload)) == {"daily"}
+
+    # An hour on, the hourly forecast and air quality are sliced further along
+    current = payload["weather"]["current"]
+    current["time"] = current["time"][:11] + f"{int(current['time'][11:13]) + 1:02}:15"
+    assert first.changed_sections(ArednMeshWeatherData.from_dict(payload)) == {
+        "current",
+        "daily",
+        "hourly",
+        "air",
+    }
+
+
+def test_malformed_alerts_when_materialized() -> None:
+    """Errors in lazily parsed sections surface as InvalidData when materialized."""
+    payload = load_payload()
+    payload["nws_alerts"]["features"][0]["properties"] = ["not", "an", "object"]
+    with pytest.raises(InvalidData):
+        parse_body(json.dumps(payload).encode(), "", materialize=True)
+
+
+def test_time_index() -> None:
+    """Timestamps are found by text, at the resolution of the moment given."""
+    times = ["2026-10-17T12:00", "2026-10-17T13:00", "2026-10-17T14:00"]
+    assert time_index(times, "2026-10-17T13:00") == 1
+    assert time_index(times, "2026-10-17T13:15") == 2
+    assert time_index(times, "2026-10-17") == 0
+    assert time_index(times, "2026-10-17T14:01") == len(times)
+    assert time_index([], "2026-10-17T13:15") == 0
+
+
+def test_join_matches_hours() -> None:
+    """Joined columns line up by hour, missing where the other section is."""
+    series = ForecastSeries.from_payload(
+        {
+            "time": ["2026-10-17T12:00", "2026-10-17T13:00", "2026-10-17T14:00"],
+            "temperature_2m": [60.0, 61.0, 62.0],
+        },
+        (("temperature", "temperature_2m", False),),
+    )
+    series.join(
+        {
+            "time": ["2026-10-17T11:00", "2026-10-17T13:00", "2026-10-17T14:00"],
+            "us_aqi": [40, 41, None],
+            "pm2_5": [1.0, 2.0, 3.0],
+        },
+        AIR_FIELDS,
+    )
+    assert series.column("aqi") == [None, 41, None]
+    assert series.column("pm25") == [None, 2.0, 3.0]
+
+    series.join({}, (("uv", "uv_index", False),))
+    assert series.column("uv") == [None, None, None]
+
+
+def test_forecast_starts_after_now() -> None:
+    """Between two hours, the hourly forecast starts at the next one."""
+    payload = load_payload()
+    payload["weather"]["current"]["time"] = "2026-10-17T13:15"
+    data = ArednMeshWeatherData.from_dict(payload)
+    assert data.forecast_hourly.times[0] == "2026-10-17T14:00"
+    assert data.forecast_daily.times[0] == "2026-10-17"
+
+
+def test_forecast_ended() -> None:
+    """Once now is past the last hour, the hourly forecast is empty."""
+    payload = load_payload()
+    last = payload["weather"]["hourly"]["time"][-1]
+    payload["weather"]["current"]["time"] = last[:11] + "23:30"
+    data = ArednMeshWeatherData.from_dict(payload)
+    data.materialize()
+    assert len(data.forecast_hourly) == 0
+    assert list(data.forecast_hourly) == []
+    assert data.aqi_peak is None
+    assert data.outlook.temperature_max is None
+    assert data.outlook.precipitation_start is None
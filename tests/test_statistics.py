@@ -0,0 +1,59 @@
+"""Tests for importing AREDN Mesh Weather statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.aredn_mesh_weather.const import DOMAIN
+
+from .conftest import expire, setup_entry
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .conftest import StandInNode
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, enable_custom_integrations: None
+) -> None:
+    """Enable loading the integration, with the recorder set up first."""
+
+
+async def poll_two_hours(
+    hass: HomeAssistant, entry: MockConfigEntry, stand_in_node: StandInNode
+) -> MagicMock:
+    """Poll the node in two hours, completing the first; return the import mock."""
+    with patch(
+        "custom_components.aredn_mesh_weather.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        coordinator = await setup_entry(hass, entry)
+        stand_in_node.publish(time="2026-10-17T14:15")
+        expire(coordinator)
+        await coordinator.async_refresh()
+    return add_statistics
+
+
+async def test_hours_follow_the_time_zone(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Statistics land in the UTC hour of the node's local time."""
+    await hass.config.async_set_time_zone("US/Pacific")
+    add_statistics = await poll_two_hours(hass, config_entry, stand_in_node)
+
+    assert add_statistics.call_count
+    # The hour of the first sample, taken at 13:15 node time
+    hour = dt_util.as_utc(datetime(2026, 10, 17, 13))  # noqa: DTZ001
+    assert hour.hour == 20
+    for call in add_statistics.call_args_list:
+        _, metadata, rows = call.args
+        assert metadata["source"] == DOMAIN
+        assert [row["start"] for row in rows] == [hour]
@@ -0,0 +1,52 @@
+"""Tests for the AREDN Mesh Weather weather entity."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.components.weather import DOMAIN as WEATHER_DOMAIN
+from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.aredn_mesh_weather.const import DOMAIN
+
+from .conftest import setup_entry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .conftest import StandInNode
+
+
+async def test_forecast_temperatures_follow_the_entity_unit(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stand_in_node: StandInNode
+) -> None:
+    """Heat index and wind chill are converted along with the temperature."""
+    await setup_entry(hass, config_entry)
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id(
+        WEATHER_DOMAIN, DOMAIN, config_entry.unique_id
+    )
+    registry.async_update_entity_options(
+        entity_id,
+        WEATHER_DOMAIN,
+        {"temperature_unit": UnitOfTemperature.CELSIUS},
+    )
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        WEATHER_DOMAIN,
+        "get_forecasts",
+        {"entity_id": entity_id, "type": "hourly"},
+        blocking=True,
+        return_response=True,
+    )
+    native = hass.data[DOMAIN][config_entry.entry_id].data.forecast_hourly
+    forecast = response[entity_id]["forecast"]
+    for row, heat_index, wind_chill in zip(
+        forecast, native.column("heat_index"), native.column("wind_chill"), strict=True
+    ):
+        assert row["heat_index"] == pytest.approx((heat_index - 32) / 1.8, abs=0.05)
+        assert row["wind_chill"] == pytest.approx((wind_chill - 32) / 1.8, abs=0.05)